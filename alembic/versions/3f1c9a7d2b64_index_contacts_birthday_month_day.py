@@ -0,0 +1,35 @@
+"""index contacts birthday month day
+
+Revision ID: 3f1c9a7d2b64
+Revises: e625890ea555
+Create Date: 2026-10-14 12:31:08.918245
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c9a7d2b64'
+down_revision: Union[str, None] = 'e625890ea555'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index('ix_contacts_user_birthday', table_name='contacts')
+    op.create_index(
+        'ix_contacts_user_birthday_mmdd',
+        'contacts',
+        ['user_id', sa.text('(EXTRACT(month FROM birthday) * 100 + EXTRACT(day FROM birthday))')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_contacts_user_birthday_mmdd', table_name='contacts')
+    op.create_index('ix_contacts_user_birthday', 'contacts', ['user_id', 'birthday'], unique=False)
@@ -0,0 +1,33 @@
+"""add contacts search trgm index
+
+Revision ID: 8b2e4d61c0f7
+Revises: 3f1c9a7d2b64
+Create Date: 2026-10-14 13:05:42.117630
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b2e4d61c0f7'
+down_revision: Union[str, None] = '3f1c9a7d2b64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX ix_contacts_search_trgm ON contacts "
+        "USING gin ((first_name || ' ' || last_name || ' ' || email) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Розширення pg_trgm не видаляємо: воно може використовуватися іншими об'єктами БД.
+    op.drop_index('ix_contacts_search_trgm', table_name='contacts')
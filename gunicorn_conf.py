@@ -0,0 +1,32 @@
+"""
+Модуль gunicorn_conf
+
+Конфігурація Gunicorn для production-запуску FastAPI-застосунку:
+
+    gunicorn -c gunicorn_conf.py main:app
+
+- Запускає кілька процесів-воркерів (2 * CPU + 1), щоб CPU-навантаження
+  (bcrypt, JWT, Pydantic) розподілялося між ядрами, а не впиралося в GIL.
+- Використовує UvicornWorker; цикл подій "auto" обирає uvloop, який
+  встановлюється разом із `uvicorn[standard]`.
+- Експортує WEB_CONCURRENCY у середовище воркерів: кожен воркер має власний пул
+  з'єднань з БД і пул потоків для хешування паролів, тож їхні типові розміри
+  діляться на кількість воркерів. Разом усі воркери відкривають не більше
+  DB_MAX_CONNECTIONS (типово 80) з'єднань з PostgreSQL, що вміщується в типовий
+  max_connections=100; на 8 ядрах це 17 воркерів по 4 з'єднання (2 + 2 overflow).
+  Пул хешування має по одному потоку на воркер (HASH_WORKERS), тобто до 17
+  одночасних хешів argon2 (~1,1 ГБ пам'яті) замість 8 на кожен воркер.
+
+Значення можна перевизначити змінними середовища GUNICORN_BIND та WEB_CONCURRENCY.
+"""
+
+import multiprocessing
+import os
+
+bind = os.getenv("GUNICORN_BIND", "0.0.0.0:8000")
+workers = int(os.getenv("WEB_CONCURRENCY", (2 * multiprocessing.cpu_count()) + 1))
+os.environ["WEB_CONCURRENCY"] = str(workers)
+worker_class = "uvicorn.workers.UvicornWorker"
+keepalive = 5
+graceful_timeout = 30
+timeout = 60
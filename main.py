@@ -4,20 +4,30 @@
 Це основний модуль запуску FastAPI-застосунку для менеджера контактів.
 
 - Ініціалізує FastAPI застосунок з відповідними middleware.
+- Використовує ORJSONResponse (orjson) як стандартний клас відповіді.
+- Створює та закриває пул з'єднань Redis у lifespan застосунку.
+- Налаштовує логування через QueueHandler/QueueListener (src.conf.log).
 - Додає підтримку CORS для клієнта на `http://localhost:3000`.
 - Реєструє маршрути з модулів `contacts`, `auth`, `users`.
-- Використовує обмеження швидкості запитів через `slowapi`.
+- Використовує обмеження швидкості запитів через `slowapi` зі сховищем у Redis.
 - Визначає обробку винятку при перевищенні ліміту запитів (429 Too Many Requests).
+
+Запуск для розробки: `python main.py` (uvicorn з reload).
+Запуск у production: `gunicorn -c gunicorn_conf.py main:app`.
 """
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request, status
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.responses import JSONResponse
-from slowapi import Limiter
-from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 
 from src.api import contacts, auth, users
+from src.services.limiter import limiter
+from src.services.cache import get_redis, close_redis
+from src.conf.log import setup_logging, stop_logging
 import asyncio
 import sys
 
@@ -28,8 +38,26 @@ origins = [
     "http://localhost:3000",
 ]
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Життєвий цикл застосунку: вмикає логування через чергу і створює пул
+    з'єднань Redis під час старту, закриває їх під час зупинки.
+
+    :param app: Екземпляр FastAPI
+    """
+    setup_logging()
+    get_redis()
+    yield
+    await close_redis()
+    stop_logging()
+
 # Ініціалізація FastAPI-застосунку
-app = FastAPI(title="Contact Manager API")
+app = FastAPI(
+    title="Contact Manager API",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
+)
 
 # Додавання CORS middleware
 app.add_middleware(
@@ -40,8 +68,7 @@ app.add_middleware(
     allow_headers=["*"],             # Дозволені заголовки
 )
 
-# Налаштування обмеження запитів (Rate limiting)
-limiter = Limiter(key_func=get_remote_address)
+# Налаштування обмеження запитів (Rate limiting), спільне для всіх воркерів через Redis
 app.state.limiter = limiter
 
 @app.exception_handler(RateLimitExceeded)
@@ -62,7 +89,7 @@ app.include_router(contacts.router, prefix="/api")
 app.include_router(auth.router, prefix="/api")
 app.include_router(users.router, prefix="/api")
 
-# Запуск застосунку через uvicorn
+# Запуск застосунку через uvicorn (для розробки; у production — gunicorn_conf.py)
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("main:app", host="127.0.0.1", port=8000, reload=True)
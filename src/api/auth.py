@@ -18,12 +18,17 @@ from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks,
 from sqlalchemy.orm import Session
 from fastapi.security import OAuth2PasswordRequestForm
 from src.schemas import UserCreate, Token, User, RequestEmail
-from src.services.auth import create_access_token, Hash, get_email_from_token
-from src.services.users import UserService
+from src.services.auth import (
+    create_access_token,
+    hasher,
+    decode_email_token,
+    invalidate_user_cache,
+    revoke_user_tokens,
+)
+from src.services.users import UserService, LOGIN_COLUMNS
 from src.services.email import send_email, create_email_token
 from src.database.db import get_db
-from src.conf.config import settings
-from jose import JWTError, jwt
+from src.database.models import Role
 from src.services.email import send_reset_password_email
 
 from fastapi.responses import HTMLResponse
@@ -54,15 +59,16 @@ async def register_user(
     """
     user_service = UserService(db)
 
-    email_user = await user_service.get_user_by_email(user_data.email)
-    if email_user:
+    email_taken, username_taken = await user_service.check_user_exists(
+        user_data.email, user_data.username
+    )
+    if email_taken:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Користувач з таким email вже існує",
         )
 
-    username_user = await user_service.get_user_by_username(user_data.username)
-    if username_user:
+    if username_taken:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="Користувач з таким іменем вже існує",
@@ -71,7 +77,7 @@ async def register_user(
         "email": user_data.email,
         "sub": user_data.email,
         "username": user_data.username,
-        "password": Hash().get_password_hash(user_data.password)
+        "password": await hasher.get_password_hash(user_data.password)
     }
     token = create_email_token(token_data)
 
@@ -91,29 +97,35 @@ async def confirmed_email(token: str, db: Session = Depends(get_db)):
     Підтвердження електронної пошти користувача за токеном.
 
     Якщо токен дійсний і користувач не існує,
-    створюється новий підтверджений користувач.
+    створюється новий підтверджений користувач. Наявний непідтверджений
+    користувач (лист, надісланий через /request_email) позначається як підтверджений.
 
     :param token: JWT токен для підтвердження
     :param db: Сесія бази даних
     :return: Повідомлення про створення або наявність користувача
     """
     try:
-        payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM])
-        email = payload.get("sub")
-        username = payload.get("username")
-        password = payload.get("password")
-
-        user_service = UserService(db)
-        existing_user = await user_service.get_user_by_email(email)
-        if existing_user:
+        payload = await decode_email_token(token)
+    except HTTPException:
+        raise HTTPException(status_code=422, detail="Невірний токен")
+
+    email = payload.get("sub")
+    username = payload.get("username")
+    password = payload.get("password")
+
+    user_service = UserService(db)
+    existing_user = await user_service.get_user_by_email(email)
+    if existing_user:
+        if existing_user.confirmed:
             return {"message": "Користувач уже існує"}
+        await user_service.confirm_email(email)
+        await invalidate_user_cache(existing_user.username)
+        return {"message": "Електронна пошта підтверджена"}
 
-        new_user = await user_service.create_user_from_data(email, username, password)
-        return {
-            "message": "Електронна пошта підтверджена, користувача створено"
-        }
-    except JWTError:
-        raise HTTPException(status_code=422, detail="Невірний токен")
+    new_user = await user_service.create_user_from_data(email, username, password)
+    return {
+        "message": "Електронна пошта підтверджена, користувача створено"
+    }
 
 
 @router.post("/login", response_model=Token)
@@ -124,13 +136,14 @@ async def login_user(
     Вхід користувача.
 
     Перевірка логіну і паролю, генерація токена доступу.
+    Паролі, захешовані застарілою схемою (bcrypt), перехешовуються argon2.
 
     :param form_data: Форма з логіном і паролем
     :param db: Сесія бази даних
     :return: Токен доступу
     """
     user_service = UserService(db)
-    user = await user_service.get_user_by_username(form_data.username)
+    user = await user_service.get_user_by_username(form_data.username, LOGIN_COLUMNS)
     if not user:
      raise HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -138,13 +151,19 @@ async def login_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    if not Hash().verify_password(form_data.password, user.hashed_password):
+    verified, new_hash = await hasher.verify_and_update(
+        form_data.password, user.hashed_password
+    )
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Неправильний логін або пароль",
             headers={"WWW-Authenticate": "Bearer"},
     )
 
+    if new_hash:
+        await user_service.update_password(user.email, new_hash)
+
     if not user.confirmed:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -175,8 +194,9 @@ async def request_email(
     user_service = UserService(db)
     user = await user_service.get_user_by_email(body.email)
     if user and not user.confirmed:
+        token = create_email_token({"sub": user.email, "username": user.username})
         background_tasks.add_task(
-            send_email, user.email, user.username, str(request.base_url)
+            send_email, user.email, user.username, str(request.base_url), token
         )
     return {"message": "Перевірте свою електронну пошту для підтвердження"}
 
@@ -213,45 +233,45 @@ async def forgot_password(
 async def reset_password(token: str, new_password: str = Form(...), db: Session = Depends(get_db)):
     """
     Обробляє скидання пароля з HTML-форми.
+
+    Усі access токени, видані користувачу до зміни пароля, відкликаються.
     """
     try:
-        email = await get_email_from_token(token)
+        payload = await decode_email_token(token)
     except HTTPException:
         raise HTTPException(status_code=400, detail="Невірний або прострочений токен")
+    email = payload.get("sub")
 
+    hashed_password = await hasher.get_password_hash(new_password)
     user_service = UserService(db)
-    user = await user_service.get_user_by_email(email)
+    user = await user_service.update_password(email, hashed_password)
     if not user:
         raise HTTPException(status_code=404, detail="Користувача не знайдено")
 
-    user.hashed_password = Hash().get_password_hash(new_password)
-    await db.commit()
+    await revoke_user_tokens(user.username)
     return {"message": "Пароль успішно змінено"}
     
 templates = Jinja2Templates(directory="src/services/templates")
+# Шаблон компілюється один раз під час імпорту; у ньому підставляється лише token.
+reset_password_template = templates.env.get_template("reset_password_form.html")
 
 @router.get("/reset-password/{token}", response_class=HTMLResponse)
-async def reset_password_form(token: str, request: Request):
+async def reset_password_form(token: str):
     """
     Відображає HTML-форму для скидання пароля.
     """
-    return templates.TemplateResponse("reset_password_form.html", {
-        "request": request,
-        "token": token
-    })
+    return HTMLResponse(reset_password_template.render(token=token))
     
     
 @router.patch("/users/{user_id}/role", response_model=User)
 async def change_user_role(user_id: int, new_role: str, db: Session = Depends(get_db)):
+    if new_role not in ["admin", "user"]:
+        raise HTTPException(status_code=400, detail="Invalid role")
+
     user_service = UserService(db)
-    user = await user_service.get_user_by_id(user_id)
+    user = await user_service.update_role(user_id, Role(new_role))
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
-    if new_role not in ["admin", "user"]:
-        raise HTTPException(status_code=400, detail="Invalid role")
-
-    user.role = new_role
-    await db.commit()
-    await db.refresh(user)
+    await invalidate_user_cache(user.username)
     return user
\ No newline at end of file
@@ -15,6 +15,7 @@
 
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.db import get_db
@@ -28,22 +29,28 @@ router = APIRouter(prefix="/contacts", tags=["contacts"])
 
 @router.get("/", response_model=List[ContactResponse])
 async def read_contacts(
-    skip: int = 0,
+    after_id: int | None = None,
     limit: int = 100,
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user)
 ):
     """
-    Отримати список контактів користувача з пагінацією.
+    Отримати список контактів користувача з keyset-пагінацією.
 
-    :param skip: Кількість пропущених записів
+    Для наступної сторінки передайте ID останнього отриманого контакту в `after_id`.
+    Список серіалізується напряму через orjson, оминаючи повторну обробку response_model.
+
+    :param after_id: ID останнього контакту попередньої сторінки
     :param limit: Максимальна кількість результатів
     :param db: Сесія бази даних
     :param user: Поточний авторизований користувач
-    :return: Список контактів
+    :return: Список контактів, відсортований за ID
     """
     service = ContactService(db)
-    return await service.get_contacts(user.id, skip, limit)
+    contacts = await service.get_contacts(user, after_id, limit)
+    return ORJSONResponse(
+        [ContactResponse.model_validate(contact).model_dump() for contact in contacts]
+    )
 
 
 @router.get("/{contact_id}", response_model=ContactResponse)
@@ -132,6 +139,8 @@ async def delete_contact(
 @router.get("/search/", response_model=List[ContactResponse])
 async def search_contacts(
     query: str,
+    after_id: int | None = None,
+    limit: int = 100,
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user)
 ):
@@ -139,12 +148,14 @@ async def search_contacts(
     Пошук контактів за ім'ям, прізвищем або email.
 
     :param query: Пошуковий запит
+    :param after_id: ID останнього контакту попередньої сторінки
+    :param limit: Максимальна кількість результатів
     :param db: Сесія бази даних
     :param user: Поточний авторизований користувач
     :return: Список знайдених контактів
     """
     service = ContactService(db)
-    return await service.search_contacts(query, user)
+    return await service.search_contacts(query, user, after_id, limit)
 
 
 @router.get("/birthdays/", response_model=List[ContactResponse])
@@ -8,24 +8,19 @@
 Маршрути потребують авторизації через JWT.
 """
 
-from fastapi import APIRouter, UploadFile, File, Depends, Request
+from fastapi import APIRouter, UploadFile, File, Depends, Request, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.database.db import get_db
-from src.services.auth import admin_required, get_current_user
+from src.services.auth import admin_required, get_current_user, invalidate_user_cache
+from src.services.users import UserService
 from src.database.models import User
-from slowapi.util import get_remote_address
-from slowapi import Limiter
+from src.services.limiter import limiter
 
-import cloudinary
-import cloudinary.uploader
-
-from src.conf.config import settings
+from src.services.cloudinary import MAX_AVATAR_SIZE, upload_avatar
 from src.schemas import User
 
 router = APIRouter(prefix="/users", tags=["users"])
 
-limiter = Limiter(key_func=get_remote_address)
-
 
 @router.get("/me", response_model=User, description="Максимум 5 запитів на хвилину")
 @limiter.limit("5/minute")
@@ -46,7 +41,6 @@ async def update_avatar(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(admin_required)
 ):
-    print(f"[DEBUG] User role: {current_user.role}")
     """
     Оновити аватар користувача, завантаживши файл на Cloudinary.
 
@@ -54,22 +48,14 @@ async def update_avatar(
     :param db: Сесія бази даних
     :param current_user: Авторизований користувач
     :return: Посилання на новий аватар
+    :raise HTTPException: 413, якщо файл більший за 5 МБ
     """
-    cloudinary.config(
-        cloud_name=settings.CLOUDINARY_NAME,
-        api_key=settings.CLOUDINARY_API_KEY,
-        api_secret=settings.CLOUDINARY_API_SECRET,
-        secure=True
-    )
+    if file.size is not None and file.size > MAX_AVATAR_SIZE:
+        raise HTTPException(status_code=413, detail="Розмір файлу не повинен перевищувати 5 МБ")
 
-    upload_result = cloudinary.uploader.upload(
-        file.file, folder="avatars", public_id=str(current_user.id)
-    )
-    avatar_url = upload_result.get("secure_url")
+    avatar_url = await upload_avatar(file.file, public_id=str(current_user.id))
 
-    current_user.avatar = avatar_url
-    db.add(current_user)
-    await db.commit()
-    await db.refresh(current_user)
+    await UserService(db).update_avatar_url(current_user.email, avatar_url)
+    await invalidate_user_cache(current_user.username)
 
     return {"avatar_url": avatar_url}
@@ -3,14 +3,15 @@
 
 Цей модуль містить конфігураційний клас Settings, який використовує бібліотеку `pydantic_settings`
 для зчитування налаштувань із файлу `.env`. Клас забезпечує централізоване управління конфігурацією,
-включаючи налаштування бази даних, JWT-токенів, електронної пошти та Cloudinary.
+включаючи налаштування бази даних, Redis, JWT-токенів, електронної пошти та Cloudinary.
+
+Функція get_settings кешує екземпляр Settings, тому `.env` розбирається один раз.
 """
 
-from pydantic import EmailStr
-from pydantic_settings import BaseSettings
-from dotenv import load_dotenv
+from functools import lru_cache
 
-load_dotenv() 
+from pydantic import EmailStr
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
@@ -18,7 +19,8 @@ class Settings(BaseSettings):
     Клас конфігурації для FastAPI-застосунку.
 
     Зчитує значення змінних середовища з `.env` файлу для:
-    - Підключення до бази даних (ASYNC і SYNC)
+    - Підключення до бази даних (ASYNC і SYNC) та параметри пулу з'єднань
+    - Підключення до Redis (кеш і обмеження частоти запитів)
     - Налаштування JWT токенів
     - Параметри електронної пошти (SMTP)
     - Параметри Cloudinary для зберігання зображень
@@ -26,6 +28,22 @@ class Settings(BaseSettings):
 
     DB_URL: str
     SYNC_DB_URL: str
+    # Кількість процесів-воркерів (gunicorn_conf.py експортує її для воркерів);
+    # від неї залежать типові розміри пулів на один процес.
+    WEB_CONCURRENCY: int = 1
+    # Загальний бюджет з'єднань з PostgreSQL на всі воркери
+    # (нижче типового max_connections=100).
+    DB_MAX_CONNECTIONS: int = 80
+    DB_POOL_SIZE: int | None = None
+    DB_MAX_OVERFLOW: int | None = None
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_STATEMENT_CACHE_SIZE: int = 500
+    REDIS_URL: str = "redis://localhost:6379/0"
+    REDIS_MAX_CONNECTIONS: int = 64
+    LOG_LEVEL: str = "INFO"
+    # Потоків для хешування паролів на один процес (None — ядра / WEB_CONCURRENCY).
+    HASH_WORKERS: int | None = None
+
     JWT_SECRET: str
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRATION_SECONDS: int = 3600
@@ -45,14 +63,24 @@ class Settings(BaseSettings):
     CLOUDINARY_API_KEY: str
     CLOUDINARY_API_SECRET: str
 
-    class Config:
-        """
-        Конфігурація для класу Settings.
-        """
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = True
-        extra = "ignore"  
-        
-
-settings = Settings()
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=True,
+        extra="ignore",
+    )
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """
+    Повертає єдиний екземпляр Settings.
+
+    Файл `.env` і змінні середовища читаються лише під час першого виклику.
+
+    :return: Об'єкт налаштувань застосунку.
+    """
+    return Settings()
+
+
+settings = get_settings()
@@ -0,0 +1,57 @@
+"""
+Модуль log.py
+
+Налаштування логування застосунку. Обробники запитів лише кладуть записи
+в чергу (QueueHandler), а вивід у stderr виконує окремий потік QueueListener,
+тому event loop не блокується на записі логів.
+
+Функції:
+--------
+- setup_logging: Підключає QueueHandler до кореневого логера і запускає QueueListener.
+- stop_logging: Дописує записи з черги і зупиняє QueueListener.
+"""
+
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+from src.conf.config import settings
+
+_listener: Optional[QueueListener] = None
+
+
+def setup_logging(level: str = settings.LOG_LEVEL):
+    """
+    Налаштовує кореневий логер на запис через чергу.
+
+    Повторний виклик нічого не змінює.
+
+    :param level: Рівень логування (наприклад, "INFO" або "DEBUG").
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    )
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(QueueHandler(log_queue))
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+
+
+def stop_logging():
+    """
+    Зупиняє QueueListener, попередньо записавши всі записи з черги.
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
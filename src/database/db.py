@@ -6,12 +6,15 @@
 і надає контекстний менеджер для безпечного відкриття, використання та закриття сесій.
 
 Компоненти:
+- pool_limits — розмір пулу та overflow на один процес у межах DB_MAX_CONNECTIONS.
+- engine_options — параметри пулу з'єднань і кешу підготовлених запитів для рушія.
 - DatabaseSessionManager — клас для керування сесіями бази даних.
 - get_db — залежність FastAPI для надання сесії в маршрутах.
 """
 
 import contextlib
 
+from sqlalchemy.engine import make_url
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
@@ -22,6 +25,52 @@ from sqlalchemy.ext.asyncio import (
 from src.conf.config import settings
 
 
+def pool_limits() -> tuple[int, int]:
+    """
+    Обчислює розмір пулу та max_overflow для одного процесу-воркера.
+
+    Кожен воркер має власний пул, тому загальний бюджет DB_MAX_CONNECTIONS
+    ділиться на WEB_CONCURRENCY: приблизно 2/3 з'єднань тримаються в пулі,
+    решта — overflow. Явно задані DB_POOL_SIZE / DB_MAX_OVERFLOW мають пріоритет.
+
+    :return: Кортеж (pool_size, max_overflow).
+    """
+    per_worker = max(1, settings.DB_MAX_CONNECTIONS // max(1, settings.WEB_CONCURRENCY))
+    pool_size = settings.DB_POOL_SIZE
+    if pool_size is None:
+        pool_size = max(1, per_worker * 2 // 3)
+    max_overflow = settings.DB_MAX_OVERFLOW
+    if max_overflow is None:
+        max_overflow = max(0, per_worker - pool_size)
+    return pool_size, max_overflow
+
+
+def engine_options(url: str) -> dict:
+    """
+    Повертає параметри для create_async_engine залежно від драйвера бази даних.
+
+    Для PostgreSQL налаштовується пул з'єднань (розмір, перевірка перед
+    використанням, перепідключення) та кеш підготовлених запитів asyncpg,
+    щоб повторювані SELECT не проходили parse/plan щоразу.
+
+    :param url: Рядок підключення до бази даних.
+    :return: Словник аргументів для create_async_engine.
+    """
+    if make_url(url).get_backend_name() != "postgresql":
+        return {}
+    pool_size, max_overflow = pool_limits()
+    return {
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_pre_ping": True,
+        "pool_recycle": settings.DB_POOL_RECYCLE_SECONDS,
+        "connect_args": {
+            "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        },
+    }
+
+
 class DatabaseSessionManager:
     """
     Менеджер сесій бази даних для асинхронної роботи з SQLAlchemy.
@@ -30,10 +79,11 @@ class DatabaseSessionManager:
     """
 
     def __init__(self, url: str):
-        self._engine: AsyncEngine = create_async_engine(url)
+        self._engine: AsyncEngine = create_async_engine(url, **engine_options(url))
         self._session_maker: async_sessionmaker = async_sessionmaker(
             autoflush=False,
             autocommit=False,
+            expire_on_commit=False,
             bind=self._engine
         )
 
@@ -8,12 +8,16 @@
 - Base — базовий клас для всіх моделей, створений за допомогою SQLAlchemy DeclarativeBase.
 - User — модель користувача, яка зберігає дані про ім’я, email, пароль, аватар та статус підтвердження.
 - Contact — модель контакту, пов’язана з користувачем, що зберігає інформацію про контакти користувача.
+
+Функції:
+- birthday_month_day — SQL-вираз MMDD (місяць * 100 + день) для дати народження.
+- contact_search_text — SQL-вираз "ім'я прізвище email" для пошуку контактів.
 """
 
 from datetime import datetime
 
-from sqlalchemy import Column, Integer, String, func, Date, Boolean, DateTime
-from sqlalchemy.orm import relationship, mapped_column, Mapped, DeclarativeBase
+from sqlalchemy import Column, Integer, String, func, Date, Boolean, DateTime, Index, extract, literal_column, event, DDL
+from sqlalchemy.orm import relationship, backref, mapped_column, Mapped, DeclarativeBase
 from sqlalchemy.sql.schema import ForeignKey
 
 from sqlalchemy import Enum as SqlEnum
@@ -27,7 +31,20 @@ class Base(DeclarativeBase):
     """
     pass
 
-class Role(enum.Enum):
+def birthday_month_day(column):
+    """
+    Будує SQL-вираз MMDD (місяць * 100 + день) для стовпця дати.
+
+    Рік ігнорується, тому вираз підходить для пошуку днів народження.
+    Множник рендериться літералом, щоб запит збігався з виразом індексу.
+
+    :param column: Стовпець типу Date.
+    :return: SQL-вираз з цілим значенням MMDD.
+    """
+    return extract("month", column) * literal_column("100") + extract("day", column)
+
+
+class Role(str, enum.Enum):
     admin = "admin"
     user = "user"
 
@@ -48,6 +65,9 @@ class Contact(Base):
     """
 
     __tablename__ = "contacts"
+    __table_args__ = (
+        Index("ix_contacts_user_id", "user_id", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     first_name: Mapped[str] = mapped_column(String(50), nullable=False)
@@ -59,7 +79,47 @@ class Contact(Base):
     user_id = Column(
         "user_id", ForeignKey("users.id", ondelete="CASCADE"), default=None
     )
-    user = relationship("User", backref="notes")
+    # Жоден маршрут не звертається до зв'язку; неявне lazy-завантаження в async-сесії
+    # призвело б до MissingGreenlet, тому будь-яка спроба SQL-завантаження — помилка.
+    user = relationship(
+        "User", lazy="raise_on_sql", backref=backref("notes", lazy="raise_on_sql")
+    )
+
+
+def contact_search_text():
+    """
+    Будує SQL-вираз `first_name || ' ' || last_name || ' ' || email` для пошуку контактів.
+
+    У PostgreSQL для цього виразу оголошено GIN-індекс `ix_contacts_search_trgm`
+    (gin_trgm_ops), тому запит має використовувати саме його.
+    Пробіли рендеряться літералами, щоб вираз збігався з виразом індексу.
+    """
+    separator = literal_column("' '")
+    return (
+        Contact.first_name + separator + Contact.last_name + separator + Contact.email
+    )
+
+
+Index(
+    "ix_contacts_user_birthday_mmdd",
+    Contact.user_id,
+    birthday_month_day(Contact.birthday),
+)
+
+# Триграмний індекс існує лише в PostgreSQL (розширення pg_trgm); для SQLite
+# create_all його пропускає. Оголошення в моделі потрібне, щоб autogenerate
+# Alembic не пропонував видалити індекс, створений міграцією 8b2e4d61c0f7.
+event.listen(
+    Contact.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+Index(
+    "ix_contacts_search_trgm",
+    contact_search_text().label("search_text"),
+    postgresql_using="gin",
+    postgresql_ops={"search_text": "gin_trgm_ops"},
+).ddl_if(dialect="postgresql")
 
 
 class User(Base):
@@ -78,6 +138,8 @@ class User(Base):
 
     __tablename__ = "users"
     id = Column(Integer, primary_key=True)
+    # UNIQUE-обмеження створюють btree-індекси users_username_key / users_email_key,
+    # якими користуються пошуки за username та email; окремі index=True їх лише дублювали б.
     username = Column(String, unique=True)
     email = Column(String, unique=True)
     hashed_password = Column(String)
@@ -8,13 +8,14 @@
 - ContactRepository — реалізує CRUD-операції, пошук і отримання майбутніх днів народжень.
 """
 
-from typing import List
+from typing import List, Sequence
 from datetime import datetime, timedelta
 
-from sqlalchemy import select
+from sqlalchemy import select, insert, update, or_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 
-from src.database.models import Contact
+from src.database.models import Contact, birthday_month_day, contact_search_text
 from src.schemas import ContactCreate, ContactUpdate
 
 
@@ -23,7 +24,7 @@ class ContactRepository:
     Репозиторій для управління контактами користувача.
 
     Методи:
-    - get_contacts: Отримати список контактів користувача з пагінацією.
+    - get_contacts: Отримати список контактів користувача з keyset-пагінацією.
     - get_contact_by_id: Отримати контакт за його ID, якщо він належить користувачу.
     - create_contact: Створити новий контакт для користувача.
     - update_contact: Оновити дані існуючого контакту.
@@ -40,16 +41,24 @@ class ContactRepository:
         """
         self.db = session
 
-    async def get_contacts(self, user_id: int, skip: int, limit: int) -> List[Contact]:
+    async def get_contacts(
+        self, user_id: int, after_id: int | None, limit: int, columns: Sequence | None = None
+    ) -> List[Contact]:
         """
-        Отримати всі контакти користувача з можливістю пагінації.
+        Отримати контакти користувача з keyset-пагінацією за ID.
 
         :param user_id: Ідентифікатор користувача.
-        :param skip: Кількість записів для пропуску.
+        :param after_id: ID останнього контакту попередньої сторінки (None — перша сторінка).
         :param limit: Максимальна кількість записів.
-        :return: Список контактів.
-        """
-        stmt = select(Contact).where(Contact.user_id == user_id).offset(skip).limit(limit)
+        :param columns: Атрибути Contact, які потрібно завантажити (None — усі стовпці).
+        :return: Список контактів, відсортований за ID.
+        """
+        stmt = select(Contact).where(Contact.user_id == user_id)
+        if columns:
+            stmt = stmt.options(load_only(*columns))
+        if after_id is not None:
+            stmt = stmt.where(Contact.id > after_id)
+        stmt = stmt.order_by(Contact.id).limit(limit)
         result = await self.db.execute(stmt)
         return result.scalars().all()
 
@@ -67,33 +76,36 @@ class ContactRepository:
 
     async def create_contact(self, body: ContactCreate, user_id: int) -> Contact:
         """
-        Створити новий контакт для користувача.
+        Створити новий контакт для користувача одним запитом INSERT ... RETURNING.
 
         :param body: Дані для створення контакту.
         :param user_id: Ідентифікатор користувача.
         :return: Створений об'єкт Contact.
         """
-        contact = Contact(**body.model_dump(), user_id=user_id)
-        self.db.add(contact)
+        stmt = insert(Contact).values(**body.model_dump(), user_id=user_id).returning(Contact)
+        result = await self.db.execute(stmt)
+        contact = result.scalar_one()
         await self.db.commit()
-        await self.db.refresh(contact)
         return contact
 
     async def update_contact(self, contact_id: int, body: ContactUpdate, user_id: int) -> Contact | None:
         """
-        Оновити контакт користувача.
+        Оновити контакт користувача одним запитом UPDATE ... RETURNING.
 
         :param contact_id: Ідентифікатор контакту.
         :param body: Дані для оновлення.
         :param user_id: Ідентифікатор користувача.
         :return: Оновлений об'єкт Contact або None.
         """
-        contact = await self.get_contact_by_id(contact_id, user_id)
-        if contact:
-            for key, value in body.model_dump(exclude_unset=True).items():
-                setattr(contact, key, value)
-            await self.db.commit()
-            await self.db.refresh(contact)
+        stmt = (
+            update(Contact)
+            .where(Contact.id == contact_id, Contact.user_id == user_id)
+            .values(**body.model_dump(exclude_unset=True))
+            .returning(Contact)
+        )
+        result = await self.db.execute(stmt)
+        contact = result.scalar_one_or_none()
+        await self.db.commit()
         return contact
 
     async def remove_contact(self, contact_id: int, user_id: int) -> Contact | None:
@@ -110,20 +122,25 @@ class ContactRepository:
             await self.db.commit()
         return contact
 
-    async def search_contacts(self, query: str, user_id: int) -> List[Contact]:
+    async def search_contacts(
+        self, query: str, user_id: int, after_id: int | None = None, limit: int = 100
+    ) -> List[Contact]:
         """
         Пошук контактів користувача за іменем, прізвищем або електронною поштою.
 
         :param query: Рядок пошуку.
         :param user_id: Ідентифікатор користувача.
-        :return: Список знайдених контактів.
+        :param after_id: ID останнього контакту попередньої сторінки (None — перша сторінка).
+        :param limit: Максимальна кількість записів.
+        :return: Список знайдених контактів, відсортований за ID.
         """
         stmt = select(Contact).filter(
             Contact.user_id == user_id,
-            (Contact.first_name.ilike(f"%{query}%")) |
-            (Contact.last_name.ilike(f"%{query}%")) |
-            (Contact.email.ilike(f"%{query}%"))
+            contact_search_text().ilike(f"%{query}%")
         )
+        if after_id is not None:
+            stmt = stmt.where(Contact.id > after_id)
+        stmt = stmt.order_by(Contact.id).limit(limit)
         result = await self.db.execute(stmt)
         return result.scalars().all()
 
@@ -131,16 +148,29 @@ class ContactRepository:
         """
         Отримати список контактів, дні народження яких відбудуться протягом вказаної кількості днів.
 
-        :param days: Кількість днів вперед.
+        Порівнюються лише місяць і день, тому рік народження та перехід через
+        новий рік не впливають на результат.
+
+        :param days: Кількість днів вперед. Для від'ємного значення повертається
+            порожній список.
         :param user_id: Ідентифікатор користувача.
         :return: Список контактів.
         """
+        if days < 0:
+            return []
+
         today = datetime.today().date()
         end_date = today + timedelta(days=days)
-        stmt = select(Contact).filter(
-            Contact.user_id == user_id,
-            Contact.birthday >= today,
-            Contact.birthday <= end_date
-        )
+        stmt = select(Contact).filter(Contact.user_id == user_id)
+
+        if days < 365:
+            month_day = birthday_month_day(Contact.birthday)
+            start = today.month * 100 + today.day
+            end = end_date.month * 100 + end_date.day
+            if start <= end:
+                stmt = stmt.filter(month_day.between(start, end))
+            else:
+                stmt = stmt.filter(or_(month_day >= start, month_day <= end))
+
         result = await self.db.execute(stmt)
         return result.scalars().all()
@@ -8,12 +8,20 @@
 - UserRepository — CRUD-операції для моделі User.
 """
 
-from sqlalchemy import select
+from typing import Sequence
+
+from sqlalchemy import select, exists, update, bindparam
+from sqlalchemy.orm import load_only
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.database.models import User
+from src.database.models import User, Role
 from src.schemas import UserCreate
 
+# Запити, що виконуються найчастіше, будуються один раз; значення
+# передаються через bindparam під час виконання.
+_BY_USERNAME = select(User).where(User.username == bindparam("username"))
+_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+
 
 class UserRepository:
     """
@@ -23,7 +31,12 @@ class UserRepository:
     - get_user_by_id: Отримати користувача за його унікальним ID.
     - get_user_by_username: Отримати користувача за його username.
     - get_user_by_email: Отримати користувача за email.
+    - check_user_exists: Перевірити, чи зайняті email та username.
     - create_user: Створити нового користувача з можливим аватаром.
+    - update_avatar_url: Оновити URL аватара користувача.
+    - update_password: Оновити хеш пароля користувача.
+    - update_role: Змінити роль користувача.
+    - confirm_email: Позначити email користувача як підтверджений.
     """
 
     def __init__(self, session: AsyncSession):
@@ -41,19 +54,22 @@ class UserRepository:
         :param user_id: Ідентифікатор користувача.
         :return: Об'єкт User або None, якщо користувач не знайдений.
         """
-        stmt = select(User).filter_by(id=user_id)
-        user = await self.db.execute(stmt)
-        return user.scalar_one_or_none()
+        return await self.db.get(User, user_id)
 
-    async def get_user_by_username(self, username: str) -> User | None:
+    async def get_user_by_username(
+        self, username: str, columns: Sequence | None = None
+    ) -> User | None:
         """
         Отримати користувача за username.
 
         :param username: Ім'я користувача.
+        :param columns: Атрибути User, які потрібно завантажити (None — усі стовпці).
         :return: Об'єкт User або None.
         """
-        stmt = select(User).filter_by(username=username)
-        user = await self.db.execute(stmt)
+        stmt = _BY_USERNAME
+        if columns:
+            stmt = stmt.options(load_only(*columns))
+        user = await self.db.execute(stmt, {"username": username})
         return user.scalar_one_or_none()
 
     async def get_user_by_email(self, email: str) -> User | None:
@@ -63,10 +79,25 @@ class UserRepository:
         :param email: Email користувача.
         :return: Об'єкт User або None.
         """
-        stmt = select(User).filter_by(email=email)
-        user = await self.db.execute(stmt)
+        user = await self.db.execute(_BY_EMAIL, {"email": email})
         return user.scalar_one_or_none()
 
+    async def check_user_exists(self, email: str, username: str) -> tuple[bool, bool]:
+        """
+        Перевірити одним запитом, чи існують користувачі з таким email та username.
+
+        :param email: Email користувача.
+        :param username: Ім'я користувача.
+        :return: Кортеж (email зайнятий, username зайнятий).
+        """
+        stmt = select(
+            exists().where(User.email == email),
+            exists().where(User.username == username),
+        )
+        result = await self.db.execute(stmt)
+        email_taken, username_taken = result.one()
+        return bool(email_taken), bool(username_taken)
+
     async def create_user(self, body: UserCreate, avatar: str = None) -> User:
         """
         Створити нового користувача на основі даних зі схеми.
@@ -76,11 +107,76 @@ class UserRepository:
         :return: Створений об'єкт User.
         """
         user = User(
-            **body.model_dump(exclude_unset=True, exclude={"password"}),
+            username=body.username,
+            email=body.email,
             hashed_password=body.password,
             avatar=avatar
         )
         self.db.add(user)
         await self.db.commit()
-        await self.db.refresh(user)
+        return user
+
+    async def update_avatar_url(self, email: str, url: str) -> User | None:
+        """
+        Оновити URL аватара користувача.
+
+        :param email: Email користувача.
+        :param url: Новий URL аватара.
+        :return: Оновлений об'єкт User або None, якщо користувач не знайдений.
+        """
+        user = await self.get_user_by_email(email)
+        if user:
+            user.avatar = url
+            await self.db.commit()
+        return user
+
+    async def update_password(self, email: str, hashed_password: str) -> User | None:
+        """
+        Оновити хеш пароля користувача одним запитом UPDATE ... RETURNING.
+
+        :param email: Email користувача.
+        :param hashed_password: Новий хеш пароля.
+        :return: Оновлений об'єкт User або None, якщо користувач не знайдений.
+        """
+        stmt = (
+            update(User)
+            .where(User.email == email)
+            .values(hashed_password=hashed_password)
+            .returning(User)
+        )
+        result = await self.db.execute(stmt)
+        user = result.scalar_one_or_none()
+        await self.db.commit()
+        return user
+
+    async def update_role(self, user_id: int, role: Role) -> User | None:
+        """
+        Змінити роль користувача одним запитом UPDATE ... RETURNING.
+
+        :param user_id: Ідентифікатор користувача.
+        :param role: Нова роль.
+        :return: Оновлений об'єкт User або None, якщо користувач не знайдений.
+        """
+        stmt = update(User).where(User.id == user_id).values(role=role).returning(User)
+        result = await self.db.execute(stmt)
+        user = result.scalar_one_or_none()
+        await self.db.commit()
+        return user
+
+    async def confirm_email(self, email: str) -> User | None:
+        """
+        Позначити email користувача як підтверджений одним запитом UPDATE ... RETURNING.
+
+        :param email: Email користувача.
+        :return: Оновлений об'єкт User або None, якщо користувач не знайдений.
+        """
+        stmt = (
+            update(User)
+            .where(User.email == email)
+            .values(confirmed=True)
+            .returning(User)
+        )
+        result = await self.db.execute(stmt)
+        user = result.scalar_one_or_none()
+        await self.db.commit()
         return user
@@ -57,9 +57,13 @@ class ContactResponse(ContactBase):
     """
     Схема відповіді, що включає ID контакту.
 
+    Email у відповіді береться з БД, куди він потрапив уже перевіреним,
+    тому тут він типізований як str без повторної перевірки EmailStr.
+
     :param id: Унікальний ідентифікатор контакту
     """
     id: int
+    email: str
     model_config = ConfigDict(from_attributes=True)
 
 
@@ -73,11 +77,13 @@ class User(BaseModel):
     :param username: Ім’я користувача
     :param email: Електронна пошта
     :param avatar: URL до аватара користувача
+    :param role: Роль користувача (admin або user)
     """
     id: int
     username: str
     email: str
     avatar: Optional[str] = None
+    role: str = "user"
     model_config = ConfigDict(from_attributes=True)
 
 
@@ -7,33 +7,90 @@
 Функції:
 ---------
 - create_email_token(data: dict): Генерує JWT-токен для підтвердження електронної пошти.
+- decode_email_token(token: str): Перевіряє токен з листа і повертає його payload.
 - get_email_from_token(token: str): Розшифровує токен і повертає email.
 - create_access_token(data: dict, expires_delta: Optional[int] = None): Створює access токен.
-- get_current_user(token: str, db: Session): Повертає поточного автентифікованого користувача.
+- decode_token(token: str): Залежність, що перевіряє access токен і повертає його payload.
+- get_current_user(payload: dict, db: Session): Повертає поточного автентифікованого користувача.
+- invalidate_user_cache(username: str): Видаляє користувача з кешів після зміни його даних
+  (включно з усіма записами `auth:<jti>` його токенів у Redis).
+- revoke_user_tokens(username: str): Відкликає всі access токени користувача, видані
+  до цього моменту (після скидання пароля).
 
 Класи:
 -------
 - Hash: Обгортає функціональність для хешування і перевірки паролів.
+
+Об'єкти:
+--------
+- hasher: Спільний екземпляр Hash для використання в маршрутах.
 """
 
+import asyncio
+import functools
+import hashlib
+import logging
+import os
+import time
+import uuid
 from datetime import datetime, timedelta, UTC, timezone
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from passlib.context import CryptContext
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
-from jose import JWTError, jwt
+import jwt
+from jwt import PyJWTError
 
 from src.database.db import get_db
 from src.conf.config import settings
-from src.services.users import UserService
-from src.services.cache import get_from_cache, set_to_cache
-from src.database.models import User
+from src.services.users import UserService, PROFILE_COLUMNS
+from src.services.cache import (
+    get_from_cache,
+    mget_from_cache,
+    set_to_cache,
+    invalidate,
+    add_to_index,
+    pop_index,
+)
 from src.database.models import Role
+from src.schemas import User as UserModel
 
 UTC = timezone.utc
 
+log = logging.getLogger(__name__)
+
+# Ключ, алгоритм і час життя JWT фіксуються один раз під час імпорту модуля.
+_JWT_KEY = settings.JWT_SECRET.encode()
+_ALG = settings.JWT_ALGORITHM
+_ACCESS_TTL = settings.JWT_EXPIRATION_SECONDS
+_EMAIL_TOKEN_TTL = timedelta(days=7)
+_encode = functools.partial(jwt.encode, key=_JWT_KEY, algorithm=_ALG)
+_decode = functools.partial(jwt.decode, key=_JWT_KEY, algorithms=[_ALG])
+
+# Кеш розібраних JWT-payload (ключ — sha256 токена).
+# Доступ відбувається лише з потоку event loop без await між читанням і записом,
+# тому додаткове блокування не потрібне.
+_payload_cache: TTLCache = TTLCache(maxsize=10000, ttl=30)
+# Запити до БД, що вже виконуються (ключ — username): одночасні промахи кешу
+# чекають на той самий Future замість окремих SELECT.
+_inflight: dict[str, asyncio.Future] = {}
+
+
+def _auth_key(jti: str) -> str:
+    return f"auth:{jti}"
+
+
+def _user_tokens_key(username: str) -> str:
+    return f"auth:user:{username}"
+
+
+def _revoked_key(username: str) -> str:
+    return f"auth:revoked:{username}"
+
 
 def create_email_token(data: dict):
     """
@@ -42,43 +99,76 @@ def create_email_token(data: dict):
     :param data: Дані, які будуть закодовані у токені.
     :return: JWT-токен як рядок.
     """
+    now = datetime.now(UTC)
     to_encode = data.copy()
-    expire = datetime.now(UTC) + timedelta(days=7)
-    to_encode.update({"iat": datetime.now(UTC), "exp": expire})
-    return jwt.encode(to_encode, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
+    to_encode.update({"iat": now, "exp": now + _EMAIL_TOKEN_TTL})
+    return _encode(to_encode)
 
 
-async def get_email_from_token(token: str):
+async def decode_email_token(token: str) -> dict:
     """
-    Розшифровує email із токена підтвердження.
+    Розшифровує і перевіряє токен, надісланий на email (підтвердження або скидання пароля).
 
     :param token: JWT-токен, отриманий на email.
-    :return: Електронна пошта (email), витягнута з токена.
+    :return: Перевірений payload токена.
+    :raise HTTPException: 422, якщо токен невалідний або прострочений.
     """
     try:
-        payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM])
-        print(f"[DEBUG] Token payload: {payload}")
-        return payload.get("sub")
-    except JWTError as e:
-        print(f"[ERROR] JWTError: {e}")
+        return _decode(token)
+    except PyJWTError:
         raise HTTPException(
             status_code=422,
             detail="Неправильний токен для перевірки електронної пошти"
         )
 
 
+async def get_email_from_token(token: str):
+    """
+    Розшифровує email із токена підтвердження.
+
+    :param token: JWT-токен, отриманий на email.
+    :return: Електронна пошта (email), витягнута з токена.
+    """
+    payload = await decode_email_token(token)
+    return payload.get("sub")
+
+
 class Hash:
     """
     Клас для хешування паролів та перевірки паролів.
 
+    Нові паролі хешуються argon2; хеші bcrypt вважаються застарілими і
+    перевіряються як раніше, але підлягають перехешуванню.
+
+    Обчислення хешів виконується в окремому пулі потоків, щоб не блокувати
+    event loop. Пул обмежує одночасні KDF лише в межах процесу, тому його розмір
+    (HASH_WORKERS, типово кількість ядер / WEB_CONCURRENCY) ділить ядра між
+    воркерами: кожен хеш argon2 займає 64 МіБ пам'яті.
+
     Методи:
     --------
     - get_password_hash: Хешує пароль.
     - verify_password: Перевіряє відповідність паролю та хешу.
+    - verify_and_update: Перевіряє пароль і за потреби повертає новий хеш.
     """
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    pwd_context = CryptContext(
+        schemes=["argon2", "bcrypt"],
+        deprecated="auto",
+        argon2__time_cost=2,
+        argon2__memory_cost=65536,
+        argon2__parallelism=2,
+    )
+    _executor = ThreadPoolExecutor(
+        max_workers=settings.HASH_WORKERS
+        or max(1, (os.cpu_count() or 1) // max(1, settings.WEB_CONCURRENCY)),
+        thread_name_prefix="hash",
+    )
+
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
 
-    def verify_password(self, plain_password, hashed_password):
+    async def verify_password(self, plain_password, hashed_password):
         """
         Перевіряє, чи відповідає звичайний пароль хешованому.
 
@@ -86,16 +176,31 @@ class Hash:
         :param hashed_password: Збережений хеш пароля.
         :return: True або False.
         """
-        return self.pwd_context.verify(plain_password, hashed_password)
+        return await self._run(self.pwd_context.verify, plain_password, hashed_password)
 
-    def get_password_hash(self, password: str):
+    async def verify_and_update(self, plain_password, hashed_password):
+        """
+        Перевіряє пароль і, якщо хеш створено застарілою схемою, повертає новий.
+
+        :param plain_password: Введений користувачем пароль.
+        :param hashed_password: Збережений хеш пароля.
+        :return: Кортеж (чи збігається пароль, новий хеш або None).
+        """
+        return await self._run(
+            self.pwd_context.verify_and_update, plain_password, hashed_password
+        )
+
+    async def get_password_hash(self, password: str):
         """
         Повертає хеш пароля.
 
         :param password: Пароль користувача.
         :return: Хешований пароль.
         """
-        return self.pwd_context.hash(password)
+        return await self._run(self.pwd_context.hash, password)
+
+
+hasher = Hash()
 
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
@@ -105,76 +210,174 @@ async def create_access_token(data: dict, expires_delta: Optional[int] = None):
     """
     Створює access JWT-токен для автентифікації користувача.
 
+    Кожен токен отримує унікальний ідентифікатор `jti`, за яким знімок
+    користувача кешується в Redis, та час видачі `iat` (з дробовою частиною
+    секунди), за яким перевіряється відкликання токенів.
+
     :param data: Дані, які потрібно закодувати.
     :param expires_delta: Час життя токена в секундах (опціонально).
     :return: JWT-токен як рядок.
     """
     to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.now(UTC) + timedelta(seconds=expires_delta)
-    else:
-        expire = datetime.now(UTC) + timedelta(seconds=settings.JWT_EXPIRATION_SECONDS)
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(
-        to_encode, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM
+    expire = datetime.now(UTC) + timedelta(seconds=expires_delta or _ACCESS_TTL)
+    to_encode.update({"exp": expire, "iat": time.time(), "jti": uuid.uuid4().hex})
+    return _encode(to_encode)
+
+
+async def decode_token(token: str = Depends(oauth2_scheme)) -> dict:
+    """
+    Перевіряє access JWT-токен і повертає його payload.
+
+    FastAPI кешує результат залежності в межах запиту, тому токен
+    розбирається один раз, навіть якщо від нього залежать кілька обробників.
+
+    :param token: JWT-токен.
+    :return: Розшифрований payload токена.
+    :raise HTTPException: 401, якщо токен невалідний або не містить `sub`.
+    """
+    token_key = hashlib.sha256(token.encode()).digest()
+    payload = _payload_cache.get(token_key)
+    if payload is not None and payload.get("exp", 0) > time.time():
+        return payload
+
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
     )
-    return encoded_jwt
+    try:
+        payload = _decode(token)
+    except PyJWTError:
+        raise credentials_exception
+    if payload.get("sub") is None:
+        raise credentials_exception
+    _payload_cache[token_key] = payload
+    return payload
 
 
 async def get_current_user(
-    token: str = Depends(oauth2_scheme),
+    payload: dict = Depends(decode_token),
     db: AsyncSession = Depends(get_db)
-) -> User:
+) -> UserModel:
     """
-    Отримує поточного користувача з кешу або бази даних за токеном.
+    Отримує поточного користувача з кешу або бази даних за payload токена.
 
-    :param token: JWT-токен.
+    Знімок користувача завжди повертається як схема User, зібрана через
+    model_construct без повторної валідації: дані або щойно прочитані з БД,
+    або записані в кеш цим же модулем.
+
+    Знімок користувача зберігається в кеші (локальному та Redis) під ключем
+    `auth:<jti>` рівно стільки, скільки ще діє токен. Разом зі знімком (одним
+    MGET) читається позначка `auth:revoked:<username>`: токени, видані до неї,
+    відхиляються ще до звернення до кешу чи БД.
+
+    :param payload: Перевірений payload access токена.
     :param db: Сесія бази даних.
-    :return: Об'єкт користувача (User).
-    :raise HTTPException: Якщо токен невалідний або користувача не існує.
+    :return: Схема користувача (src.schemas.User).
+    :raise HTTPException: Якщо користувача не існує або токен відкликано.
     """
+    username = payload["sub"]
+    jti = payload.get("jti")
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    try:
-        payload = jwt.decode(
-            token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
-        )
-        username = payload.get("sub")
-        if username is None:
-            raise credentials_exception
-    except JWTError:
+    if jti is not None:
+        cached_user, revoked = await mget_from_cache([_auth_key(jti), _revoked_key(username)])
+    else:
+        cached_user, revoked = None, await get_from_cache(_revoked_key(username))
+    if revoked is not None and payload.get("iat", 0) < revoked["before"]:
         raise credentials_exception
-
-    cached_user = await get_from_cache(username)
     if cached_user:
-        user = User(**cached_user)
-
-        if isinstance(user.role, str):
-            user.role = Role(user.role)
+        return UserModel.model_construct(**cached_user)
+
+    # Якщо власника запиту до БД скасовано (клієнт від'єднався), його Future
+    # теж скасовується, і ті, хто чекав, повторюють пошук самостійно.
+    while (inflight := _inflight.get(username)) is not None:
+        try:
+            cached_user = await asyncio.shield(inflight)
+        except asyncio.CancelledError:
+            if inflight.cancelled() and not asyncio.current_task().cancelling():
+                continue
+            raise
+        if cached_user is None:
+            raise credentials_exception
+        return UserModel.model_construct(**cached_user)
 
-        return user
+    future = asyncio.get_running_loop().create_future()
+    _inflight[username] = future
+    try:
+        user_service = UserService(db)
+        user = await user_service.get_user_by_username(username, PROFILE_COLUMNS)
+        cached_user = None
+        if user is not None:
+            cached_user = {
+                "id": user.id,
+                "username": user.username,
+                "email": user.email,
+                "confirmed": user.confirmed,
+                "avatar": user.avatar,
+                "role": user.role.value,
+            }
+            # Future знімається лише після запису в кеш, інакше запит, що прийде
+            # під час запису, не знайде ні кешу, ні Future і повторить SELECT.
+            if jti is not None:
+                ttl = max(int(payload["exp"] - time.time()), 1)
+                await set_to_cache(_auth_key(jti), cached_user, expire=ttl)
+                await add_to_index(_user_tokens_key(username), jti, _ACCESS_TTL)
+        future.set_result(cached_user)
+    except asyncio.CancelledError:
+        future.cancel()
+        raise
+    except Exception as e:
+        future.set_exception(e)
+        # Позначаємо виняток як отриманий, якщо на Future ніхто не чекав.
+        future.exception()
+        raise
+    finally:
+        if _inflight.get(username) is future:
+            del _inflight[username]
 
-    user_service = UserService(db)
-    user = await user_service.get_user_by_username(username)
     if user is None:
         raise credentials_exception
+    return UserModel.model_construct(**cached_user)
+
+
+async def invalidate_user_cache(username: str):
+    """
+    Видаляє збережені дані користувача з обох рівнів кешу.
+
+    Викликається після зміни ролі, аватара або пароля, щоб наступний запит
+    отримав актуальні дані з бази. У Redis видаляються записи `auth:<jti>`
+    усіх токенів користувача.
+
+    :param username: Ім'я користувача.
+    """
+    jtis = await pop_index(_user_tokens_key(username))
+    await invalidate(*(_auth_key(jti) for jti in jtis))
+
+
+async def revoke_user_tokens(username: str):
+    """
+    Відкликає всі access токени користувача, видані до цього моменту.
+
+    Записує в Redis позначку `auth:revoked:<username>` з часом відкликання;
+    get_current_user відхиляє токени з меншим `iat`. Позначка живе стільки ж,
+    скільки access токен, — після цього старі токени прострочені й без неї.
+    Кешовані знімки користувача також видаляються.
+
+    :param username: Ім'я користувача.
+    """
+    await set_to_cache(
+        _revoked_key(username), {"before": time.time()}, expire=_ACCESS_TTL, jitter=0
+    )
+    await invalidate_user_cache(username)
 
-    await set_to_cache(username, {
-        "id": user.id,
-        "username": user.username,
-        "email": user.email,
-        "confirmed": user.confirmed,
-        "avatar": user.avatar,
-        "role": user.role.value,
-    })
-    return user
-
-async def admin_required(current_user: User = Depends(get_current_user)):
-    print(f"[DEBUG] current_user.role = {current_user.role}")
+async def admin_required(current_user: UserModel = Depends(get_current_user)):
+    log.debug("current_user.role = %s", current_user.role)
     if current_user.role != Role.admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
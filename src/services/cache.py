@@ -1,14 +1,149 @@
-import redis.asyncio as redis
-import json
+"""
+Модуль services.cache
+
+Дворівневе кешування даних користувачів: локальний TTL-кеш процесу
+перед Redis.
+
+Клієнт Redis створюється один раз (лениво) поверх спільного пулу з'єднань,
+параметри якого беруться з налаштувань (REDIS_URL, REDIS_MAX_CONNECTIONS).
+Пул закривається під час завершення роботи застосунку (lifespan у main.py).
+Значення серіалізуються через orjson і зберігаються як байти, тому клієнт
+працює без decode_responses.
+
+Функції:
+--------
+- get_redis: Повертає спільний клієнт Redis.
+- close_redis: Закриває клієнт і пул з'єднань.
+- get_from_cache: Читає значення з локального кешу, а за його відсутності — з Redis.
+- mget_from_cache: Читає кілька значень; промахи локального кешу — одним MGET.
+- set_to_cache: Записує значення в обидва рівні кешу.
+- invalidate: Видаляє один або кілька ключів з обох рівнів кешу.
+- add_to_index: Додає елемент до множини-індексу з часом життя.
+- pop_index: Повертає елементи множини-індексу і видаляє її.
+"""
+
+import random
 from typing import Optional
 
-redis_client = redis.Redis(host="localhost", port=6379, decode_responses=True)
+import orjson
+import redis.asyncio as redis
+from cachetools import TTLCache
+
+from src.conf.config import settings
+
+_pool: Optional[redis.ConnectionPool] = None
+_client: Optional[redis.Redis] = None
+
+# Локальний рівень кешу. Доступ лише з event loop без await між читанням
+# і записом, тому блокування не потрібне; інші процеси бачать зміни
+# не пізніше ніж через ttl секунд.
+_local: TTLCache = TTLCache(maxsize=4096, ttl=30)
+
+
+def get_redis() -> redis.Redis:
+    """
+    Повертає спільний клієнт Redis, створюючи пул з'єднань під час першого виклику.
+
+    :return: Клієнт redis.asyncio.Redis.
+    """
+    global _pool, _client
+    if _client is None:
+        _pool = redis.ConnectionPool.from_url(
+            settings.REDIS_URL,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+        )
+        _client = redis.Redis(connection_pool=_pool)
+    return _client
+
+
+async def close_redis():
+    """
+    Закриває клієнт Redis і всі з'єднання пулу.
+    """
+    global _pool, _client
+    if _client is not None:
+        await _client.aclose()
+        await _pool.disconnect()
+        _pool = None
+        _client = None
+
 
 async def get_from_cache(key: str) -> Optional[dict]:
-    user = await redis_client.get(key)
-    if user:
-        return json.loads(user)
+    data = _local.get(key)
+    if data is not None:
+        return data
+    raw = await get_redis().get(key)
+    if raw:
+        data = orjson.loads(raw)
+        _local[key] = data
+        return data
     return None
 
-async def set_to_cache(key: str, data: dict, expire: int = 900):  
-    await redis_client.set(key, json.dumps(data), ex=expire)
+async def mget_from_cache(keys: list[str]) -> list[Optional[dict]]:
+    """
+    Повертає значення для кількох ключів. Ключі, яких немає в локальному
+    кеші, читаються з Redis одним запитом MGET.
+
+    :param keys: Список ключів.
+    :return: Список значень (None для відсутніх) у порядку ключів.
+    """
+    result = [_local.get(key) for key in keys]
+    missing = [i for i, data in enumerate(result) if data is None]
+    if missing:
+        raw_values = await get_redis().mget([keys[i] for i in missing])
+        for i, raw in zip(missing, raw_values):
+            if raw:
+                result[i] = orjson.loads(raw)
+                _local[keys[i]] = result[i]
+    return result
+
+async def set_to_cache(key: str, data: dict, expire: int = 900, jitter: int = 60):
+    """
+    Записує значення з часом життя, збільшеним на випадкову добавку,
+    щоб записи, створені одночасно, не зникали з кешу одночасно.
+
+    :param key: Ключ.
+    :param data: Дані для збереження.
+    :param expire: Базовий час життя в секундах.
+    :param jitter: Максимальна випадкова добавка до часу життя в секундах.
+    """
+    _local[key] = data
+    await get_redis().set(key, orjson.dumps(data), ex=expire + random.randint(0, jitter))
+
+async def invalidate(*keys: str):
+    """
+    Видаляє ключі з локального кешу та Redis.
+
+    :param keys: Ключі для видалення.
+    """
+    for key in keys:
+        _local.pop(key, None)
+    if keys:
+        await get_redis().delete(*keys)
+
+async def add_to_index(key: str, member: str, expire: int):
+    """
+    Додає елемент до множини-індексу і продовжує її час життя.
+
+    :param key: Ключ множини.
+    :param member: Елемент, що додається.
+    :param expire: Час життя множини в секундах.
+    """
+    async with get_redis().pipeline(transaction=False) as pipe:
+        pipe.sadd(key, member)
+        pipe.expire(key, expire)
+        await pipe.execute()
+
+async def pop_index(key: str) -> list[str]:
+    """
+    Повертає всі елементи множини-індексу і видаляє саму множину
+    (атомарно, в одній транзакції MULTI/EXEC).
+
+    :param key: Ключ множини.
+    :return: Список елементів.
+    """
+    async with get_redis().pipeline(transaction=True) as pipe:
+        pipe.smembers(key)
+        pipe.delete(key)
+        members, _ = await pipe.execute()
+    return [member.decode() for member in members]
@@ -5,12 +5,17 @@
 
 Використовується для завантаження, оновлення, видалення зображень та інших ресурсів у хмарне сховище Cloudinary.
 
-Налаштування беруться з конфігураційного файлу (через `settings` з src.conf.config).
+Налаштування беруться з конфігураційного файлу (через `settings` з src.conf.config)
+і застосовуються один раз під час імпорту модуля.
+
+Функції:
+--------
+- upload_avatar: Завантажує аватар користувача у Cloudinary і повертає його URL.
 
 Приклад:
 --------
-    import cloudinary.uploader
-    result = cloudinary.uploader.upload(file_path)
+    from src.services.cloudinary import upload_avatar
+    avatar_url = await upload_avatar(file.file, public_id=str(user.id))
 
 Змінні середовища, які мають бути задані:
 ------------------------------------------
@@ -19,7 +24,10 @@
 - CLOUDINARY_API_SECRET
 """
 
+import asyncio
+
 import cloudinary
+import cloudinary.uploader
 
 from src.conf.config import settings
 
@@ -29,3 +37,35 @@ cloudinary.config(
     api_secret=settings.CLOUDINARY_API_SECRET,
     secure=True
 )
+
+MAX_AVATAR_SIZE = 5 * 1024 * 1024
+
+# upload_large вимагає, щоб кожна частина, крім останньої, була не меншою за 5 МБ.
+# Частина розміром з максимальний аватар означає, що аватар іде одним запитом,
+# але читається з файлу потоково, а не копіюється в пам'ять повністю.
+UPLOAD_CHUNK_SIZE = MAX_AVATAR_SIZE
+
+
+async def upload_avatar(file, public_id: str) -> str:
+    """
+    Завантажує файл аватара у папку `avatars` на Cloudinary.
+
+    Файл передається через upload_large частинами розміром UPLOAD_CHUNK_SIZE
+    (не менше 5 МБ, як вимагає Cloudinary), тож аватар до MAX_AVATAR_SIZE
+    надсилається одним запитом і читається з файлу потоково. Блокуючі HTTPS-запити виконуються в окремому потоці, щоб не
+    зупиняти event loop.
+
+    :param file: Файлоподібний об'єкт із зображенням.
+    :param public_id: Публічний ідентифікатор ресурсу (ID користувача).
+    :return: Захищене посилання (secure_url) на завантажене зображення.
+    """
+    file.seek(0)
+    upload_result = await asyncio.to_thread(
+        cloudinary.uploader.upload_large,
+        file,
+        chunk_size=UPLOAD_CHUNK_SIZE,
+        resource_type="image",
+        folder="avatars",
+        public_id=public_id,
+    )
+    return upload_result.get("secure_url")
@@ -15,7 +15,7 @@
 
 Методи:
 -------
-- get_contacts: Отримати список контактів користувача з підтримкою пагінації.
+- get_contacts: Отримати список контактів користувача з keyset-пагінацією.
 - get_contact: Отримати конкретний контакт за ID.
 - create_contact: Створити новий контакт.
 - update_contact: Оновити контакт за ID.
@@ -39,16 +39,16 @@ class ContactService:
     def __init__(self, db: AsyncSession):
         self.repository = ContactRepository(db)
 
-    async def get_contacts(self, user: User, skip: int = 0, limit: int = 100):
+    async def get_contacts(self, user: User, after_id: int | None = None, limit: int = 100):
         """
-        Отримати список контактів користувача з пагінацією.
+        Отримати список контактів користувача з keyset-пагінацією.
 
         :param user: Поточний користувач
-        :param skip: Кількість контактів, які слід пропустити
+        :param after_id: ID останнього контакту попередньої сторінки
         :param limit: Кількість контактів, які слід повернути
         :return: Список контактів
         """
-        return await self.repository.get_contacts(user, skip, limit)
+        return await self.repository.get_contacts(user.id, after_id, limit)
 
     async def get_contact(self, contact_id: int, user: User):
         """
@@ -91,15 +91,19 @@ class ContactService:
         """
         return await self.repository.remove_contact(contact_id, user.id)
 
-    async def search_contacts(self, query: str, user: User):
+    async def search_contacts(
+        self, query: str, user: User, after_id: int | None = None, limit: int = 100
+    ):
         """
         Знайти контакт(и) за ключовим словом у імені, прізвищі або email.
 
         :param query: Пошукове слово
         :param user: Поточний користувач
+        :param after_id: ID останнього контакту попередньої сторінки
+        :param limit: Кількість контактів, які слід повернути
         :return: Список знайдених контактів
         """
-        return await self.repository.search_contacts(query, user.id)
+        return await self.repository.search_contacts(query, user.id, after_id, limit)
 
     async def get_upcoming_birthdays(self, days: int, user: User):
         """
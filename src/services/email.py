@@ -16,15 +16,18 @@
 Константи:
 ----------
 - conf: Об'єкт конфігурації з параметрами для поштового клієнта FastMail.
+- fm: Спільний клієнт FastMail, створений один раз під час імпорту модуля.
 """
 
+import logging
 from pathlib import Path
 from fastapi_mail import FastMail, MessageSchema, ConnectionConfig, MessageType
 from fastapi_mail.errors import ConnectionErrors
-from pydantic import EmailStr
 from src.services.auth import create_email_token
 from src.conf.config import settings
 
+log = logging.getLogger(__name__)
+
 conf = ConnectionConfig(
     MAIL_USERNAME=settings.MAIL_USERNAME,
     MAIL_PASSWORD=settings.MAIL_PASSWORD,
@@ -39,12 +42,14 @@ conf = ConnectionConfig(
     TEMPLATE_FOLDER=Path(__file__).parent / "templates"
 )
 
-async def send_email(email: EmailStr, username: str, host: str, token: str):
+fm = FastMail(conf)
+
+async def send_email(email: str, username: str, host: str, token: str):
     """
     Надсилає лист підтвердження електронної адреси користувачу.
 
     :param email: Email користувача
-    :type email: EmailStr
+    :type email: str
     :param username: Ім'я користувача
     :type username: str
     :param host: Базова адреса хосту застосунку (наприклад, http://127.0.0.1:8000)
@@ -59,12 +64,11 @@ async def send_email(email: EmailStr, username: str, host: str, token: str):
             template_body={"host": host, "username": username, "token": token},
             subtype=MessageType.html
         )
-        fm = FastMail(conf)
         await fm.send_message(message, template_name="verify_email.html")
     except ConnectionErrors as err:
-        print(err)
+        log.warning("Email send error: %s", err)
 
-async def send_reset_password_email(email: EmailStr, username: str, host: str, token: str):
+async def send_reset_password_email(email: str, username: str, host: str, token: str):
     """
     Надсилає листа для скидання пароля.
 
@@ -80,7 +84,6 @@ async def send_reset_password_email(email: EmailStr, username: str, host: str, t
             template_body={"host": host, "username": username, "token": token},
             subtype=MessageType.html
         )
-        fm = FastMail(conf)
         await fm.send_message(message, template_name="reset_password.html")
     except ConnectionErrors as err:
-        print(f"Email send error: {err}")
\ No newline at end of file
+        log.warning("Email send error: %s", err)
\ No newline at end of file
@@ -0,0 +1,27 @@
+"""
+Модуль services.limiter
+
+Спільний обмежувач частоти запитів (slowapi) для всього застосунку.
+
+Лічильники зберігаються в Redis, тому ліміт діє спільно для всіх процесів
+uvicorn/gunicorn, а неактивні ключі автоматично видаляються через EXPIRE.
+Стратегія moving-window у бібліотеці `limits` виконується атомарним
+Lua-скриптом на боці Redis. Якщо Redis недоступний, використовується
+тимчасове сховище в пам'яті процесу.
+
+Об'єкти:
+--------
+- limiter: Екземпляр Limiter, який використовують main.py та маршрути.
+"""
+
+from slowapi import Limiter
+from slowapi.util import get_remote_address
+
+from src.conf.config import settings
+
+limiter = Limiter(
+    key_func=get_remote_address,
+    storage_uri=settings.REDIS_URL,
+    strategy="moving-window",
+    in_memory_fallback_enabled=True,
+)
@@ -8,21 +8,53 @@
 ------
 - UserService: Обробляє логіку створення, пошуку та підтвердження користувачів.
 
+Константи:
+----------
+- LOGIN_COLUMNS: Стовпці користувача, потрібні для перевірки логіну.
+- PROFILE_COLUMNS: Стовпці користувача, потрібні для get_current_user.
+
+Функції:
+--------
+- gravatar_url: Формує URL аватара Gravatar з email без мережевих запитів.
+
 Методи:
 -------
 - create_user: Створює нового користувача з автоматично згенерованим аватаром через Gravatar.
 - get_user_by_id: Повертає користувача за його ID.
 - get_user_by_username: Повертає користувача за ім’ям.
 - get_user_by_email: Повертає користувача за email.
+- check_user_exists: Перевіряє, чи зайняті email та ім’я користувача.
 - create_user_from_data: Створює підтвердженого користувача з даних, отриманих після верифікації email.
+- update_avatar_url: Оновлює URL аватара користувача.
+- update_password: Оновлює хеш пароля користувача.
+- update_role: Змінює роль користувача.
+- confirm_email: Позначає email наявного користувача як підтверджений.
 """
 
+import hashlib
+
 from sqlalchemy.ext.asyncio import AsyncSession
-from libgravatar import Gravatar
 
 from src.repository.users import UserRepository
 from src.schemas import UserCreate
-from src.database.models import User
+from src.database.models import User, Role
+
+LOGIN_COLUMNS = (User.id, User.username, User.email, User.hashed_password, User.confirmed, User.role)
+PROFILE_COLUMNS = (User.id, User.username, User.email, User.avatar, User.confirmed, User.role)
+
+
+def gravatar_url(email: str) -> str:
+    """
+    Формує URL аватара Gravatar: MD5 від нормалізованого email.
+
+    :param email: Email користувача
+    :type email: str
+    :return: URL зображення
+    :rtype: str
+    """
+    email_hash = hashlib.md5(email.strip().lower().encode()).hexdigest()
+    return f"https://www.gravatar.com/avatar/{email_hash}?d=identicon"
+
 
 class UserService:
     """
@@ -37,21 +69,14 @@ class UserService:
 
     async def create_user(self, body: UserCreate):
         """
-        Створює нового користувача. Автоматично додає аватар з Gravatar, якщо доступний.
+        Створює нового користувача з аватаром Gravatar, обчисленим з email.
 
         :param body: Дані для створення користувача
         :type body: UserCreate
         :return: Об’єкт створеного користувача
         :rtype: User
         """
-        avatar = None
-        try:
-            g = Gravatar(body.email)
-            avatar = g.get_image()
-        except Exception as e:
-            print(e)
-
-        return await self.repository.create_user(body, avatar)
+        return await self.repository.create_user(body, gravatar_url(body.email))
 
     async def get_user_by_id(self, user_id: int):
         """
@@ -64,16 +89,17 @@ class UserService:
         """
         return await self.repository.get_user_by_id(user_id)
 
-    async def get_user_by_username(self, username: str):
+    async def get_user_by_username(self, username: str, columns=None):
         """
         Отримує користувача за ім'ям.
 
         :param username: Ім’я користувача
         :type username: str
+        :param columns: Стовпці, які потрібно завантажити (None — усі)
         :return: Об’єкт користувача або None
         :rtype: User | None
         """
-        return await self.repository.get_user_by_username(username)
+        return await self.repository.get_user_by_username(username, columns)
 
     async def get_user_by_email(self, email: str):
         """
@@ -86,6 +112,19 @@ class UserService:
         """
         return await self.repository.get_user_by_email(email)
     
+    async def check_user_exists(self, email: str, username: str):
+        """
+        Перевіряє, чи зайняті email та ім’я користувача.
+
+        :param email: Email користувача
+        :type email: str
+        :param username: Ім’я користувача
+        :type username: str
+        :return: Кортеж (email зайнятий, ім’я зайняте)
+        :rtype: tuple[bool, bool]
+        """
+        return await self.repository.check_user_exists(email, username)
+
     async def create_user_from_data(self, email: str, username: str, password: str):
         """
         Створює нового підтвердженого користувача після переходу за посиланням з email.
@@ -99,5 +138,47 @@ class UserService:
         user = User(email=email, username=username, hashed_password=password, confirmed=True)
         self.db.add(user)
         await self.db.commit()
-        await self.db.refresh(user)
         return user
+
+    async def update_avatar_url(self, email: str, url: str):
+        """
+        Оновлює URL аватара користувача.
+
+        :param email: Email користувача
+        :param url: Новий URL аватара
+        :return: Оновлений об’єкт користувача або None
+        :rtype: User | None
+        """
+        return await self.repository.update_avatar_url(email, url)
+
+    async def update_password(self, email: str, hashed_password: str):
+        """
+        Оновлює хеш пароля користувача.
+
+        :param email: Email користувача
+        :param hashed_password: Новий хеш пароля
+        :return: Оновлений об’єкт користувача або None
+        :rtype: User | None
+        """
+        return await self.repository.update_password(email, hashed_password)
+
+    async def update_role(self, user_id: int, role: Role):
+        """
+        Змінює роль користувача.
+
+        :param user_id: Ідентифікатор користувача
+        :param role: Нова роль
+        :return: Оновлений об’єкт користувача або None
+        :rtype: User | None
+        """
+        return await self.repository.update_role(user_id, role)
+
+    async def confirm_email(self, email: str):
+        """
+        Позначає email наявного користувача як підтверджений.
+
+        :param email: Email користувача
+        :return: Оновлений об’єкт користувача або None
+        :rtype: User | None
+        """
+        return await self.repository.confirm_email(email)
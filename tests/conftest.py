@@ -1,46 +1,85 @@
 import asyncio
+import os
+import sys
+
 import pytest
 import pytest_asyncio
-from sqlalchemy.pool import StaticPool
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import NullPool, StaticPool
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from passlib.context import CryptContext
 
 from main import app
 from src.database.models import Base, User
 from src.database.db import get_db
 from src.services.auth import create_access_token, Hash
-from sqlalchemy import select
-from unittest.mock import AsyncMock, patch
+from unittest.mock import Mock
+import fakeredis
 from httpx import AsyncClient, ASGITransport
-SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
-from unittest.mock import AsyncMock, patch
+SQLALCHEMY_DATABASE_URL = os.getenv("TEST_DB_URL", "sqlite+aiosqlite:///:memory:")
 
-@pytest.fixture(autouse=True)
-def mock_redis_cache():
-    with patch("src.services.cache.get_from_cache", new_callable=AsyncMock) as mock_get, \
-         patch("src.services.cache.set_to_cache", new_callable=AsyncMock) as mock_set:
-        mock_get.return_value = None
-        yield (mock_get, mock_set)
-
-engine = create_async_engine(
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
-)
 
+def create_test_engine(url: str):
+    # SQLite (типово в пам'яті): одне спільне з'єднання (StaticPool), тож усі
+    # сесії бачать ту саму базу. Інші БД (Postgres) — без пулу, щоб
+    # з'єднання не переживали event loop, у якому створені.
+    if make_url(url).get_backend_name() == "sqlite":
+        return create_async_engine(
+            url,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+    return create_async_engine(url, poolclass=NullPool)
+
+
+engine = create_test_engine(SQLALCHEMY_DATABASE_URL)
+
+
+# pysqlite/aiosqlite самостійно керують BEGIN і ламають SAVEPOINT;
+# передаємо керування транзакціями SQLAlchemy (рецепт з документації SQLite-діалекту).
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_driver_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+
+# Сесії приєднуються до зовнішньої транзакції тесту: commit() у коді
+# застосунку лише звільняє SAVEPOINT, а відкат транзакції прибирає всі зміни.
 TestingSessionLocal = async_sessionmaker(
-    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=False,
+    bind=engine,
+    join_transaction_mode="create_savepoint",
 )
 
-@pytest.fixture(autouse=True)
-def mock_redis_client(monkeypatch):
-    class MockRedis:
-        async def get(self, *args, **kwargs):
-            return None
+@pytest_asyncio.fixture(autouse=True)
+async def mock_redis_cache(monkeypatch):
+    # Redis у пам'яті процесу: справжні TTL, множини і пайплайни без мережі.
+    client = fakeredis.FakeAsyncRedis()
+    monkeypatch.setattr("src.services.cache.get_redis", lambda: client)
+    yield client
+    await client.aclose()
 
-        async def set(self, *args, **kwargs):
-            return None
+@pytest.fixture(autouse=True)
+def mock_send_email(monkeypatch):
+    # Жоден тест не ставить у фонові задачі справжнє надсилання листів.
+    mock = Mock()
+    monkeypatch.setattr("src.api.auth.send_email", mock)
+    monkeypatch.setattr("src.api.auth.send_reset_password_email", Mock())
+    return mock
 
-    monkeypatch.setattr("src.services.cache.redis_client", MockRedis())
+@pytest.fixture(autouse=True)
+def clear_auth_cache():
+    from src.services.auth import _payload_cache
+    from src.services.cache import _local
+    _payload_cache.clear()
+    _local.clear()
 
 test_user = {
     "username": "deadpool",
@@ -48,30 +87,91 @@ test_user = {
     "password": "12345678",
 }
 
-@pytest.fixture(scope="module", autouse=True)
-def init_models_wrap():
-    async def init_models():
-        async with engine.begin() as conn:
+
+def expect_json(response, status_code: int):
+    # Перевіряє статус до розбору тіла; у разі помилки показує текст відповіді.
+    assert response.status_code == status_code, response.text
+    return response.json()
+
+
+def pytest_collection_modifyitems(items):
+    # Усі async-тести виконуються в одному event loop сесії разом із фікстурами.
+    session_scope_marker = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if pytest_asyncio.is_async_test(item):
+            item.add_marker(session_scope_marker, append=False)
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    # uvloop (приходить разом з uvicorn[standard]) швидше планує корутини,
+    # що помітно на тестах із великою кількістю AsyncMock; на Windows його немає.
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_password_hashing():
+    # Ті самі схеми, що й у застосунку, але з мінімальною вартістю KDF.
+    fast_context = CryptContext(
+        schemes=["argon2", "bcrypt"],
+        deprecated="auto",
+        argon2__time_cost=1,
+        argon2__memory_cost=8,
+        argon2__parallelism=1,
+        bcrypt__rounds=4,
+    )
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(Hash, "pwd_context", fast_context)
+        yield
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session", autouse=True)
+async def init_models(fast_password_hashing):
+    # База в пам'яті завжди порожня, тож drop_all і перевірки існування
+    # таблиць (checkfirst) лише додають зайві запити; для зовнішньої БД
+    # спершу прибираємо старі таблиці, після чого вони гарантовано відсутні.
+    async with engine.begin() as conn:
+        if engine.url.database not in (None, "", ":memory:"):
             await conn.run_sync(Base.metadata.drop_all)
-            await conn.run_sync(Base.metadata.create_all)
-        async with TestingSessionLocal() as session:
-            hashed_password = Hash().get_password_hash(test_user["password"])
-            user = User(
-                username=test_user["username"],
-                email=test_user["email"],
-                hashed_password=hashed_password,
-                confirmed=True,
-                role="admin",
-                avatar="https://example.com/avatar.png",
-            )
-            session.add(user)
-            await session.commit()
-
-    asyncio.run(init_models())
-    
+        await conn.run_sync(Base.metadata.create_all, checkfirst=False)
+    async with TestingSessionLocal() as session:
+        hashed_password = await Hash().get_password_hash(test_user["password"])
+        user = User(
+            username=test_user["username"],
+            email=test_user["email"],
+            hashed_password=hashed_password,
+            confirmed=True,
+            role="admin",
+            avatar="https://example.com/avatar.png",
+        )
+        session.add(user)
+        await session.commit()
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def db_connection(init_models):
+    async with engine.connect() as conn:
+        trans = await conn.begin()
+        TestingSessionLocal.configure(bind=conn)
+        yield conn
+        TestingSessionLocal.configure(bind=engine)
+        await trans.rollback()
 
 
 @pytest_asyncio.fixture
+async def session():
+    async with TestingSessionLocal() as session:
+        yield session
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def async_client():
     async def override_get_db():
         async with TestingSessionLocal() as session:
@@ -83,10 +183,9 @@ async def async_client():
     async with AsyncClient(transport=transport, base_url="http://test") as client:
         yield client
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def get_token():
-    async with TestingSessionLocal() as session:
-        user = await session.execute(select(User).where(User.email == test_user["email"]))
-        user = user.scalar_one_or_none()
-        return await create_access_token(data={"sub": user.username})
-
+    # Токен для засіяного користувача підписується один раз на всю сесію.
+    return await create_access_token(
+        data={"sub": test_user["username"]}, expires_delta=60 * 60
+    )
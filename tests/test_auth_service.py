@@ -0,0 +1,90 @@
+import asyncio
+import time
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.database.models import Role, User
+from src.services.auth import get_current_user
+
+
+@pytest.mark.asyncio
+@patch("src.services.auth.UserService")
+async def test_get_current_user_coalesces_cache_misses(mock_user_service):
+    async def slow_lookup(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return User(id=1, username="herd", email="herd@example.com", confirmed=True, role=Role.user)
+
+    mock_lookup = AsyncMock(side_effect=slow_lookup)
+    mock_user_service.return_value.get_user_by_username = mock_lookup
+    payload = {"sub": "herd", "exp": time.time() + 60}
+
+    users = await asyncio.gather(*(get_current_user(payload, db=None) for _ in range(5)))
+
+    mock_lookup.assert_awaited_once()
+    assert all(user.username == "herd" for user in users)
+
+
+@pytest.mark.asyncio
+@patch("src.services.auth.add_to_index", new_callable=AsyncMock)
+@patch("src.services.auth.set_to_cache")
+@patch("src.services.auth.UserService")
+async def test_get_current_user_coalesces_misses_during_cache_write(
+    mock_user_service, mock_set_to_cache, mock_add_to_index
+):
+    lookup_done = asyncio.Event()
+
+    async def lookup(*args, **kwargs):
+        lookup_done.set()
+        return User(id=1, username="herd", email="herd@example.com", confirmed=True, role=Role.user)
+
+    async def slow_cache_write(*args, **kwargs):
+        await asyncio.sleep(0.01)
+
+    mock_lookup = AsyncMock(side_effect=lookup)
+    mock_user_service.return_value.get_user_by_username = mock_lookup
+    mock_set_to_cache.side_effect = slow_cache_write
+    payload = {"sub": "herd", "jti": "write-window", "exp": time.time() + 60}
+
+    first = asyncio.create_task(get_current_user(payload, db=None))
+    await lookup_done.wait()
+    # Запит із бази вже виконано, а запис у кеш ще триває.
+    late = await asyncio.gather(*(get_current_user(payload, db=None) for _ in range(3)))
+
+    assert (await first).username == "herd"
+    assert all(user.username == "herd" for user in late)
+    mock_lookup.assert_awaited_once()
+    mock_set_to_cache.assert_awaited_once()
+    mock_add_to_index.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+@patch("src.services.auth.get_from_cache", new=AsyncMock(return_value=None))
+@patch("src.services.auth.UserService")
+async def test_get_current_user_owner_cancellation_does_not_fail_waiters(mock_user_service):
+    first_lookup_started = asyncio.Event()
+    calls = 0
+
+    async def lookup(*args, **kwargs):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            first_lookup_started.set()
+            await asyncio.sleep(10)
+        return User(id=1, username="herd", email="herd@example.com", confirmed=True, role=Role.user)
+
+    mock_user_service.return_value.get_user_by_username = AsyncMock(side_effect=lookup)
+    payload = {"sub": "herd", "exp": time.time() + 60}
+
+    owner = asyncio.create_task(get_current_user(payload, db=None))
+    await first_lookup_started.wait()
+    waiter = asyncio.create_task(get_current_user(payload, db=None))
+    await asyncio.sleep(0)
+
+    owner.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await owner
+
+    # Той, хто чекав, сам повторює пошук замість отримати чужий CancelledError.
+    assert (await waiter).username == "herd"
+    assert calls == 2
@@ -0,0 +1,36 @@
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.services.cache import get_from_cache, mget_from_cache, set_to_cache, invalidate
+
+
+@pytest.mark.asyncio
+@patch("src.services.cache.get_redis")
+async def test_local_tier_serves_and_invalidates(mock_get_redis):
+    mock_redis = mock_get_redis.return_value
+    mock_redis.set = AsyncMock()
+    mock_redis.get = AsyncMock(return_value=None)
+    mock_redis.delete = AsyncMock()
+
+    await set_to_cache("auth:abc", {"username": "deadpool"})
+    assert await get_from_cache("auth:abc") == {"username": "deadpool"}
+    mock_redis.get.assert_not_awaited()
+
+    await invalidate("auth:abc")
+    assert await get_from_cache("auth:abc") is None
+    mock_redis.delete.assert_awaited_once_with("auth:abc")
+    mock_redis.get.assert_awaited_once_with("auth:abc")
+
+
+@pytest.mark.asyncio
+@patch("src.services.cache.get_redis")
+async def test_mget_from_cache_fetches_only_local_misses(mock_get_redis):
+    mock_redis = mock_get_redis.return_value
+    mock_redis.set = AsyncMock()
+    mock_redis.mget = AsyncMock(return_value=[b'{"username": "remote"}', None])
+
+    await set_to_cache("auth:local", {"username": "local"})
+    result = await mget_from_cache(["auth:local", "auth:remote", "auth:missing"])
+
+    assert result == [{"username": "local"}, {"username": "remote"}, None]
+    mock_redis.mget.assert_awaited_once_with(["auth:remote", "auth:missing"])
@@ -0,0 +1,32 @@
+import io
+
+import pytest
+from unittest.mock import patch
+
+from src.services.cloudinary import MAX_AVATAR_SIZE, UPLOAD_CHUNK_SIZE, upload_avatar
+
+
+def test_upload_chunk_size_meets_cloudinary_minimum():
+    # Cloudinary відхиляє частини upload_large, менші за 5 МБ (окрім останньої).
+    assert UPLOAD_CHUNK_SIZE >= 5 * 1024 * 1024
+    assert UPLOAD_CHUNK_SIZE >= MAX_AVATAR_SIZE
+
+
+@pytest.mark.asyncio
+@patch("src.services.cloudinary.cloudinary.uploader.upload_large")
+async def test_upload_avatar(mock_upload):
+    mock_upload.return_value = {"secure_url": "https://example.com/avatar.png"}
+    file = io.BytesIO(b"0" * 16)
+    file.read()
+
+    url = await upload_avatar(file, public_id="1")
+
+    assert url == "https://example.com/avatar.png"
+    mock_upload.assert_called_once_with(
+        file,
+        chunk_size=UPLOAD_CHUNK_SIZE,
+        resource_type="image",
+        folder="avatars",
+        public_id="1",
+    )
+    assert file.tell() == 0
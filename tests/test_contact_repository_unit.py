@@ -4,7 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models import Contact, User
 from src.repository.contacts import ContactRepository
-from src.schemas import ContactCreate
+from src.schemas import ContactCreate, ContactUpdate
 
 
 @pytest.fixture
@@ -28,7 +28,7 @@ async def test_get_contacts(contact_repository, mock_session, user):
     ]
     mock_session.execute = AsyncMock(return_value=mock_result)
 
-    contacts = await contact_repository.get_contacts(user_id=user.id, skip=0, limit=10)
+    contacts = await contact_repository.get_contacts(user_id=user.id, after_id=None, limit=10)
 
     assert len(contacts) == 1
     assert contacts[0].first_name == "Alice"
@@ -54,15 +54,41 @@ async def test_create_contact(contact_repository, mock_session, user):
     contact_data = ContactCreate(
         first_name="Bob", last_name="Johnson", email="bob@example.com", phone="123-456-7890"
     )
+    mock_result = MagicMock()
+    mock_result.scalar_one.return_value = Contact(
+        id=1, **contact_data.model_dump(), user_id=user.id
+    )
+    mock_session.execute = AsyncMock(return_value=mock_result)
 
     result = await contact_repository.create_contact(body=contact_data, user_id=user.id)
 
     assert isinstance(result, Contact)
     assert result.first_name == "Bob"
     assert result.email == "bob@example.com"
-    mock_session.add.assert_called_once()
+    mock_session.execute.assert_awaited_once()
+    mock_session.commit.assert_awaited_once()
+    mock_session.refresh.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_update_contact(contact_repository, mock_session, user):
+    contact_data = ContactUpdate(
+        first_name="Bobby", last_name="Johnson", email="bobby@example.com", phone="123-456-7890"
+    )
+    mock_result = MagicMock()
+    mock_result.scalar_one_or_none.return_value = Contact(
+        id=1, **contact_data.model_dump(), user_id=user.id
+    )
+    mock_session.execute = AsyncMock(return_value=mock_result)
+
+    result = await contact_repository.update_contact(
+        contact_id=1, body=contact_data, user_id=user.id
+    )
+
+    assert result is not None
+    assert result.first_name == "Bobby"
+    mock_session.execute.assert_awaited_once()
     mock_session.commit.assert_awaited_once()
-    mock_session.refresh.assert_awaited_once_with(result)
 
 
 @pytest.mark.asyncio
@@ -1,8 +1,10 @@
+import jwt
 import pytest
-from unittest.mock import Mock
+from passlib.hash import bcrypt
+from sqlalchemy import select
 from src.database.models import User
-from src.services.auth import Hash
-from tests.conftest import TestingSessionLocal
+from src.services.auth import Hash, create_access_token, create_email_token
+from tests.conftest import expect_json, test_user
 
 user_data = {
     "username": "agent007",
@@ -12,86 +14,207 @@ user_data = {
 
 
 @pytest.mark.asyncio
-async def test_signup(async_client, monkeypatch):
-    mock_send_email = Mock()
-    monkeypatch.setattr("src.api.auth.send_email", mock_send_email)
+async def test_signup_then_repeat(async_client, session, mock_send_email):
+    # Користувач створюється лише після підтвердження пошти, тож повторна
+    # реєстрація до підтвердження знову надсилає лист, а не повертає 409.
+    for _ in range(2):
+        response = await async_client.post("/api/auth/register", json=user_data)
+        data = expect_json(response, 201)
+        assert data["message"] == "Перевірте вашу пошту для підтвердження реєстрації"
 
-    response = await async_client.post("/api/auth/register", json=user_data)
-    assert response.status_code == 201
-    data = response.json()
-    assert data["message"] == "Перевірте вашу пошту для підтвердження реєстрації"
+    assert mock_send_email.call_count == 2
+    result = await session.execute(select(User).where(User.email == user_data["email"]))
+    assert result.scalar_one_or_none() is None
 
 
 @pytest.mark.asyncio
-async def test_repeat_signup(async_client, monkeypatch):
-    mock_send_email = Mock()
-    monkeypatch.setattr("src.api.auth.send_email", mock_send_email)
-
-    response = await async_client.post("/api/auth/register", json=user_data)
-    assert response.status_code == 201
-    assert response.json()["message"] == "Перевірте вашу пошту для підтвердження реєстрації"
+async def test_signup_existing_email(async_client, mock_send_email):
+    response = await async_client.post("/api/auth/register", json={
+        "username": "another_deadpool",
+        "email": "deadpool@example.com",
+        "password": "12345678",
+    })
+    assert expect_json(response, 409)["detail"] == "Користувач з таким email вже існує"
+    mock_send_email.assert_not_called()
 
 
 @pytest.mark.asyncio
-async def test_not_confirmed_login(async_client):
-    async with TestingSessionLocal() as session:
-        hashed_password = Hash().get_password_hash(user_data["password"])
-        user = User(
-            username="notconfirmed",
-            email="notconfirmed@example.com",
-            hashed_password=hashed_password,
-            confirmed=False
-        )
-        session.add(user)
-        await session.commit()
+async def test_not_confirmed_login(async_client, session):
+    hashed_password = await Hash().get_password_hash(user_data["password"])
+    user = User(
+        username="notconfirmed",
+        email="notconfirmed@example.com",
+        hashed_password=hashed_password,
+        confirmed=False
+    )
+    session.add(user)
+    await session.commit()
 
     response = await async_client.post("/api/auth/login", data={
         "username": "notconfirmed",
         "password": user_data["password"]
     })
-    assert response.status_code == 401
-    data = response.json()
+    data = expect_json(response, 401)
     assert data["detail"] == "Електронна адреса не підтверджена"
 
 
+@pytest.mark.asyncio
+async def test_request_email_sends_token(async_client, session, mock_send_email):
+    session.add(User(username="resend", email="resend@example.com", confirmed=False))
+    await session.commit()
+
+    response = await async_client.post("/api/auth/request_email", json={"email": "resend@example.com"})
+    assert response.status_code == 200
+    mock_send_email.assert_called_once()
+    email, username, _, token = mock_send_email.call_args.args
+    assert (email, username) == ("resend@example.com", "resend")
+
+    response = await async_client.get(f"/api/auth/confirmed_email/{token}")
+    assert expect_json(response, 200)["message"] == "Електронна пошта підтверджена"
+
+    result = await session.execute(select(User.confirmed).where(User.email == "resend@example.com"))
+    assert result.scalar_one() is True
+
+
 @pytest.mark.asyncio
 async def test_login(async_client):
     response = await async_client.post("/api/auth/login", data={
         "username": "deadpool",
         "password": "12345678"
     })
-    assert response.status_code == 200
-    data = response.json()
+    data = expect_json(response, 200)
     assert "access_token" in data
 
 
 @pytest.mark.asyncio
-async def test_wrong_password_login(async_client):
+async def test_login_rehashes_legacy_bcrypt(async_client, session):
+    user = User(
+        username="legacy",
+        email="legacy@example.com",
+        hashed_password=bcrypt.using(rounds=4).hash(user_data["password"]),
+        confirmed=True
+    )
+    session.add(user)
+    await session.commit()
+
     response = await async_client.post("/api/auth/login", data={
-        "username": user_data["username"],
-        "password": "wrong_password"
+        "username": "legacy",
+        "password": user_data["password"]
     })
-    assert response.status_code == 401
-    data = response.json()
-    assert data["detail"] == "Неправильний логін або пароль"
+    assert response.status_code == 200
+
+    await session.refresh(user)
+    assert user.hashed_password.startswith("$argon2")
 
 
 @pytest.mark.asyncio
-async def test_wrong_username_login(async_client):
-    response = await async_client.post("/api/auth/login", data={
-        "username": "nonexistent_user",
-        "password": user_data["password"]
+async def test_access_token_has_unique_jti():
+    first = jwt.decode(await create_access_token({"sub": "deadpool"}), options={"verify_signature": False})
+    second = jwt.decode(await create_access_token({"sub": "deadpool"}), options={"verify_signature": False})
+    assert first["jti"] != second["jti"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "payload, status_code, detail",
+    [
+        ({"username": user_data["username"], "password": "wrong_password"}, 401, "Неправильний логін або пароль"),
+        ({"username": "nonexistent_user", "password": user_data["password"]}, 401, "Неправильний логін або пароль"),
+        ({"password": user_data["password"]}, 422, None),
+    ],
+    ids=["wrong_password", "wrong_username", "validation_error"],
+)
+async def test_login_failures(async_client, payload, status_code, detail):
+    response = await async_client.post("/api/auth/login", data=payload)
+    data = expect_json(response, status_code)
+    if detail is None:
+        assert "detail" in data
+    else:
+        assert data["detail"] == detail
+
+
+@pytest.mark.asyncio
+async def test_confirmed_email(async_client):
+    token = create_email_token({
+        "sub": "confirmed@example.com",
+        "username": "confirmed",
+        "password": "hashed-password",
     })
-    assert response.status_code == 401
-    data = response.json()
-    assert data["detail"] == "Неправильний логін або пароль"
+
+    response = await async_client.get(f"/api/auth/confirmed_email/{token}")
+    assert expect_json(response, 200)["message"] == "Електронна пошта підтверджена, користувача створено"
 
 
 @pytest.mark.asyncio
-async def test_validation_error_login(async_client):
+async def test_confirmed_email_invalid_token(async_client):
+    response = await async_client.get("/api/auth/confirmed_email/not-a-token")
+    assert expect_json(response, 422)["detail"] == "Невірний токен"
+
+
+@pytest.mark.asyncio
+async def test_reset_password_form(async_client):
+    response = await async_client.get("/api/auth/reset-password/some-token")
+    assert response.status_code == 200
+    assert 'action="/api/auth/reset-password/some-token"' in response.text
+
+
+@pytest.mark.asyncio
+async def test_reset_password(async_client):
+    token = create_email_token({"sub": "deadpool@example.com"})
+
+    response = await async_client.post(
+        f"/api/auth/reset-password/{token}", data={"new_password": "12345678"}
+    )
+    assert expect_json(response, 200)["message"] == "Пароль успішно змінено"
+
+
+@pytest.mark.asyncio
+async def test_reset_password_revokes_issued_tokens(async_client):
     response = await async_client.post("/api/auth/login", data={
-        "password": user_data["password"]
+        "username": test_user["username"],
+        "password": test_user["password"],
     })
-    assert response.status_code == 422
-    data = response.json()
-    assert "detail" in data
+    old_token = expect_json(response, 200)["access_token"]
+    headers = {"Authorization": f"Bearer {old_token}"}
+    assert (await async_client.get("/api/contacts/", headers=headers)).status_code == 200
+
+    token = create_email_token({"sub": test_user["email"]})
+    response = await async_client.post(
+        f"/api/auth/reset-password/{token}", data={"new_password": test_user["password"]}
+    )
+    assert response.status_code == 200
+
+    response = await async_client.get("/api/contacts/", headers=headers)
+    assert response.status_code == 401
+
+    response = await async_client.post("/api/auth/login", data={
+        "username": test_user["username"],
+        "password": test_user["password"],
+    })
+    new_token = expect_json(response, 200)["access_token"]
+    response = await async_client.get(
+        "/api/contacts/", headers={"Authorization": f"Bearer {new_token}"}
+    )
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_reset_password_unknown_user(async_client):
+    token = create_email_token({"sub": "nobody@example.com"})
+
+    response = await async_client.post(
+        f"/api/auth/reset-password/{token}", data={"new_password": "12345678"}
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_change_user_role(async_client):
+    response = await async_client.patch("/api/auth/users/1/role?new_role=admin")
+    assert expect_json(response, 200)["username"] == "deadpool"
+
+
+@pytest.mark.asyncio
+async def test_change_user_role_invalid(async_client):
+    response = await async_client.patch("/api/auth/users/1/role?new_role=superuser")
+    assert response.status_code == 400
@@ -1,50 +1,74 @@
 import pytest
+import pytest_asyncio
 from datetime import date, timedelta
+from sqlalchemy import select
+
+from src.database.models import Contact, User
+from tests.conftest import expect_json, test_user
+
+contact_data = {
+    "first_name": "John",
+    "last_name": "Doe",
+    "email": "john.doe@example.com",
+    "phone": "+1234567890",
+    "birthday": "1990-01-01",
+    "extra_data": "Friend from college"
+}
+
+
+@pytest_asyncio.fixture
+async def created_contact(async_client, get_token):
+    response = await async_client.post(
+        "/api/contacts/",
+        json=contact_data,
+        headers={"Authorization": f"Bearer {get_token}"}
+    )
+    return expect_json(response, 201)
+
 
 @pytest.mark.asyncio
 async def test_create_contact(async_client, get_token):
-    contact_data = {
-        "first_name": "John",
-        "last_name": "Doe",
-        "email": "john.doe@example.com",
-        "phone": "+1234567890",
-        "birthday": "1990-01-01",
-        "extra_data": "Friend from college"
-    }
     response = await async_client.post(
         "/api/contacts/",
         json=contact_data,
         headers={"Authorization": f"Bearer {get_token}"}
     )
-    assert response.status_code == 201
-    data = response.json()
+    data = expect_json(response, 201)
     assert data["email"] == contact_data["email"]
-    test_create_contact.contact_id = data["id"]  
 
 
 @pytest.mark.asyncio
-async def test_read_contacts(async_client, get_token):
+async def test_read_contacts(async_client, get_token, created_contact):
     response = await async_client.get(
         "/api/contacts/",
         headers={"Authorization": f"Bearer {get_token}"}
     )
-    assert response.status_code == 200
-    assert isinstance(response.json(), list)
+    contacts = expect_json(response, 200)
+    assert any(contact["id"] == created_contact["id"] for contact in contacts)
+
+
+@pytest.mark.asyncio
+async def test_read_contacts_after_id(async_client, get_token, created_contact):
+    response = await async_client.get(
+        f"/api/contacts/?after_id={created_contact['id']}",
+        headers={"Authorization": f"Bearer {get_token}"}
+    )
+    contacts = expect_json(response, 200)
+    assert all(contact["id"] > created_contact["id"] for contact in contacts)
 
 
 @pytest.mark.asyncio
-async def test_read_single_contact(async_client, get_token):
+async def test_read_single_contact(async_client, get_token, created_contact):
     response = await async_client.get(
-        f"/api/contacts/{test_create_contact.contact_id}",
+        f"/api/contacts/{created_contact['id']}",
         headers={"Authorization": f"Bearer {get_token}"}
     )
-    assert response.status_code == 200
-    data = response.json()
-    assert data["id"] == test_create_contact.contact_id
+    data = expect_json(response, 200)
+    assert data["id"] == created_contact["id"]
 
 
 @pytest.mark.asyncio
-async def test_update_contact(async_client, get_token):
+async def test_update_contact(async_client, get_token, created_contact):
     updated_data = {
         "first_name": "Johnny",
         "last_name": "Doe",
@@ -54,59 +78,93 @@ async def test_update_contact(async_client, get_token):
         "extra_data": "Updated info"
     }
     response = await async_client.put(
-        f"/api/contacts/{test_create_contact.contact_id}",
+        f"/api/contacts/{created_contact['id']}",
         json=updated_data,
         headers={"Authorization": f"Bearer {get_token}"}
     )
-    assert response.status_code == 200
-    data = response.json()
+    data = expect_json(response, 200)
     assert data["email"] == updated_data["email"]
 
 
 @pytest.mark.asyncio
-async def test_search_contacts(async_client, get_token):
+async def test_search_contacts(async_client, get_token, created_contact):
     response = await async_client.get(
-        "/api/contacts/search/?query=Johnny",
+        "/api/contacts/search/?query=John",
         headers={"Authorization": f"Bearer {get_token}"}
     )
-    assert response.status_code == 200
-    results = response.json()
-    assert any("Johnny" in contact["first_name"] for contact in results)
+    results = expect_json(response, 200)
+    assert any(contact["id"] == created_contact["id"] for contact in results)
+
+
+@pytest_asyncio.fixture
+async def seeded_user_id(session):
+    return await session.scalar(select(User.id).filter_by(username=test_user["username"]))
 
 
 @pytest.mark.asyncio
-async def test_upcoming_birthdays(async_client, get_token):
-    today = date.today()
-    near_birthday = (today + timedelta(days=3)).strftime("%Y-%m-%d")
+async def test_upcoming_birthdays(async_client, get_token, session, seeded_user_id):
+    session.add(Contact(
+        first_name="Birthday",
+        last_name="Soon",
+        email="bday@example.com",
+        phone="+1230000000",
+        birthday=date.today() + timedelta(days=3),
+        user_id=seeded_user_id,
+    ))
+    await session.commit()
 
-    await async_client.post(
-        "/api/contacts/",
-        json={
-            "first_name": "Birthday",
-            "last_name": "Soon",
-            "email": "bday@example.com",
-            "phone": "+1230000000",
-            "birthday": near_birthday,
-            "extra_data": "Test birthday"
-        },
+    response = await async_client.get(
+        "/api/contacts/birthdays/?days=5",
         headers={"Authorization": f"Bearer {get_token}"}
     )
+    results = expect_json(response, 200)
+    assert any("Birthday" in contact["first_name"] for contact in results)
+
+
+@pytest.mark.asyncio
+async def test_upcoming_birthdays_ignores_birth_year(async_client, get_token, session, seeded_user_id):
+    session.add(Contact(
+        first_name="Anniversary",
+        last_name="Past",
+        email="anniversary@example.com",
+        phone="+1230000001",
+        birthday=(date.today() + timedelta(days=2)).replace(year=2000),
+        user_id=seeded_user_id,
+    ))
+    await session.commit()
 
     response = await async_client.get(
         "/api/contacts/birthdays/?days=5",
         headers={"Authorization": f"Bearer {get_token}"}
     )
-    assert response.status_code == 200
-    results = response.json()
-    assert any("Birthday" in contact["first_name"] for contact in results)
+    results = expect_json(response, 200)
+    assert any(contact["first_name"] == "Anniversary" for contact in results)
+
+
+@pytest.mark.asyncio
+async def test_upcoming_birthdays_negative_days(async_client, get_token, session, seeded_user_id):
+    session.add(Contact(
+        first_name="Far",
+        last_name="Away",
+        email="far@example.com",
+        phone="+1230000002",
+        birthday=date.today() + timedelta(days=100),
+        user_id=seeded_user_id,
+    ))
+    await session.commit()
+
+    response = await async_client.get(
+        "/api/contacts/birthdays/?days=-1",
+        headers={"Authorization": f"Bearer {get_token}"}
+    )
+    assert expect_json(response, 200) == []
 
 
 @pytest.mark.asyncio
-async def test_delete_contact(async_client, get_token):
+async def test_delete_contact(async_client, get_token, created_contact):
     response = await async_client.delete(
-        f"/api/contacts/{test_create_contact.contact_id}",
+        f"/api/contacts/{created_contact['id']}",
         headers={"Authorization": f"Bearer {get_token}"}
     )
-    assert response.status_code == 200
-    deleted = response.json()
-    assert deleted["id"] == test_create_contact.contact_id
+    deleted = expect_json(response, 200)
+    assert deleted["id"] == created_contact["id"]
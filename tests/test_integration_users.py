@@ -1,5 +1,11 @@
+import io
+from pathlib import Path
+
 import pytest
-from tests.conftest import  test_user
+from unittest.mock import AsyncMock
+from tests.conftest import expect_json, test_user
+
+AVATAR_BYTES = (Path(__file__).parent / "assets" / "avatar.png").read_bytes()
 
 
 @pytest.mark.asyncio
@@ -8,24 +14,38 @@ async def test_get_current_user(async_client, get_token, mock_redis_cache):
         "/api/users/me",
         headers={"Authorization": f"Bearer {get_token}"}
     )
-    assert response.status_code == 200
-    data = response.json()
+    data = expect_json(response, 200)
     assert data["email"] == test_user["email"]
     assert data["username"] == test_user["username"]
     assert "avatar" in data
+    assert data["role"] == "admin"
+    assert await mock_redis_cache.keys("auth:*")
 
 
 
 @pytest.mark.asyncio
-async def test_update_avatar(async_client, get_token, mock_redis_cache):
-    with open("tests/assets/avatar.png", "rb") as f:
-        response = await async_client.post(
-            "/api/users/avatar",
-            headers={"Authorization": f"Bearer {get_token}"},
-            files={"file": ("avatar.png", f, "image/png")}
-        )
-
-    assert response.status_code == 200
-    data = response.json()
+async def test_update_avatar(async_client, get_token, mock_redis_cache, monkeypatch):
+    mock_upload = AsyncMock(return_value="https://res.cloudinary.com/test/avatar.png")
+    monkeypatch.setattr("src.api.users.upload_avatar", mock_upload)
+
+    response = await async_client.post(
+        "/api/users/avatar",
+        headers={"Authorization": f"Bearer {get_token}"},
+        files={"file": ("avatar.png", io.BytesIO(AVATAR_BYTES), "image/png")}
+    )
+
+    data = expect_json(response, 200)
     assert "avatar_url" in data
-    assert data["avatar_url"].startswith("https://res.cloudinary.com")
\ No newline at end of file
+    assert data["avatar_url"].startswith("https://res.cloudinary.com")
+    mock_upload.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_update_avatar_too_large(async_client, get_token, mock_redis_cache):
+    response = await async_client.post(
+        "/api/users/avatar",
+        headers={"Authorization": f"Bearer {get_token}"},
+        files={"file": ("avatar.png", b"0" * (5 * 1024 * 1024 + 1), "image/png")}
+    )
+
+    assert response.status_code == 413
@@ -1,55 +1,58 @@
 import pytest
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models import User
-from src.repository.users import UserRepository
+from src.repository.users import UserRepository, _BY_EMAIL, _BY_USERNAME
 from src.schemas import UserCreate
 
 
-@pytest.fixture
-def mock_session():
-    return AsyncMock(spec=AsyncSession)
+def _result(user):
+    return SimpleNamespace(scalar_one_or_none=lambda: user)
 
-@pytest.fixture
-def user_repository(mock_session):
-    return UserRepository(mock_session)
 
-@pytest.mark.asyncio
-async def test_get_user_by_email(user_repository, mock_session):
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = User(id=1, username="testuser", email="test@example.com")
-    mock_session.execute = AsyncMock(return_value=mock_result)
-
-    user = await user_repository.get_user_by_email("test@example.com")
+class _FakeSession:
+    """Лише ті методи AsyncSession, які викликає UserRepository."""
 
-    assert user is not None
-    assert user.email == "test@example.com"
-    assert user.username == "testuser"
+    def __init__(self):
+        self.execute = AsyncMock()
+        self.get = AsyncMock()
+        self.add = MagicMock()
+        self.commit = AsyncMock()
+        self.refresh = AsyncMock()
 
 
-@pytest.mark.asyncio
-async def test_get_user_by_id(user_repository, mock_session):
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = User(id=1, username="testuser", email="test@example.com")
-    mock_session.execute = AsyncMock(return_value=mock_result)
-
-    user = await user_repository.get_user_by_id(1)
-
-    assert user is not None
-    assert user.id == 1
+@pytest.fixture
+def mock_session():
+    return _FakeSession()
 
+@pytest.fixture
+def user_repository(mock_session):
+    return UserRepository(mock_session)
 
 @pytest.mark.asyncio
-async def test_get_user_by_username(user_repository, mock_session):
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = User(id=1, username="testuser", email="test@example.com")
-    mock_session.execute = AsyncMock(return_value=mock_result)
-
-    user = await user_repository.get_user_by_username("testuser")
-
-    assert user is not None
-    assert user.username == "testuser"
+@pytest.mark.parametrize(
+    "method, arg, session_method, expected_call",
+    [
+        ("get_user_by_email", "test@example.com", "execute", (_BY_EMAIL, {"email": "test@example.com"})),
+        ("get_user_by_id", 1, "get", (User, 1)),
+        ("get_user_by_username", "testuser", "execute", (_BY_USERNAME, {"username": "testuser"})),
+    ],
+)
+async def test_get_user(user_repository, mock_session, method, arg, session_method, expected_call):
+    found = User(id=1, username="testuser", email="test@example.com")
+    # Заглушка лише для того методу сесії, який має викликати репозиторій.
+    if session_method == "execute":
+        mock_session.execute.return_value = _result(found)
+    else:
+        mock_session.get.return_value = found
+
+    user = await getattr(user_repository, method)(arg)
+
+    assert user is found
+    getattr(mock_session, session_method).assert_awaited_once_with(*expected_call)
+    unused = mock_session.get if session_method == "execute" else mock_session.execute
+    unused.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -65,4 +68,4 @@ async def test_create_user(user_repository, mock_session):
 
     mock_session.add.assert_called_once()
     mock_session.commit.assert_awaited_once()
-    mock_session.refresh.assert_awaited_once_with(result)
+    mock_session.refresh.assert_not_awaited()